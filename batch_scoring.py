@@ -0,0 +1,70 @@
+import numpy as np
+
+from ngram_model import ALPHABET_SIZE, NgramModel
+
+# Code for separators and any character outside a-z. Lookup tables get an
+# extra all-zero row/column for it, so n-grams touching it score 0 exactly
+# like a missing key in the {ngram: count} dicts.
+_OTHER = ALPHABET_SIZE
+_SIZE = ALPHABET_SIZE + 1
+
+def lookup_tables(model: NgramModel):
+    """
+    Returns dense int64 bigram (27*27) and trigram (27**3) tables for a model,
+    padded with zeros for the non-letter code. Cached on the model.
+    """
+    tables = getattr(model, "_numpy_tables", None)
+    if tables is None:
+        bigrams = np.zeros((_SIZE, _SIZE), dtype=np.int64)
+        bigrams[:ALPHABET_SIZE, :ALPHABET_SIZE] = np.frombuffer(
+            model.bigram_counts, dtype=np.uint64).reshape(ALPHABET_SIZE, ALPHABET_SIZE)
+        trigrams = np.zeros((_SIZE, _SIZE, _SIZE), dtype=np.int64)
+        trigrams[:ALPHABET_SIZE, :ALPHABET_SIZE, :ALPHABET_SIZE] = np.frombuffer(
+            model.trigram_counts, dtype=np.uint64).reshape(ALPHABET_SIZE, ALPHABET_SIZE, ALPHABET_SIZE)
+        tables = (bigrams.ravel(), trigrams.ravel())
+        model._numpy_tables = tables
+    return tables
+
+def encode_words(words):
+    """
+    Encodes words as one int64 code array, each word followed by a separator.
+    Returns (codes, starts, lengths) where starts/lengths are per word and count
+    characters, not bytes.
+    """
+    words = list(words)
+    lengths = np.fromiter((len(w) for w in words), dtype=np.int64, count=len(words))
+    text = "\n".join(words) + "\n"
+    chars = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    codes = chars.astype(np.int64) - ord("a")
+    codes[(codes < 0) | (codes >= ALPHABET_SIZE)] = _OTHER
+    starts = np.zeros(len(words), dtype=np.int64)
+    if len(words) > 1:
+        np.cumsum(lengths[:-1] + 1, out=starts[1:])
+    return codes, starts, lengths
+
+def _window_sums(values, starts, lengths):
+    # values[i] is the score of the n-gram starting at position i; a word's n-grams
+    # start at positions start..start+length-1 (trailing ones hit the separator
+    # and are 0), so each word's total is a difference of prefix sums.
+    prefix = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(values, out=prefix[1:])
+    return prefix[starts + lengths] - prefix[starts]
+
+def score_words_numpy(words, model: NgramModel, weight: float = 0.5):
+    """
+    Vectorized combined_score for many words at once. Returns a float64 array
+    equal to [combined_score(w, bigram_freq, trigram_freq, weight) for w in words].
+    """
+    bigram_table, trigram_table = lookup_tables(model)
+    codes, starts, lengths = encode_words(words)
+    if len(lengths) == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    padded = np.append(codes, [_OTHER, _OTHER])
+    bigram_values = bigram_table[padded[:-2] * _SIZE + padded[1:-1]]
+    trigram_values = trigram_table[(padded[:-2] * _SIZE + padded[1:-1]) * _SIZE + padded[2:]]
+
+    score_b = _window_sums(bigram_values, starts, lengths).astype(np.float64)
+    score_t = _window_sums(trigram_values, starts, lengths).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (score_b * weight + score_t * (1 - weight)) / lengths
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from rich.console import Console
+
+from bulk_export import EXPORT_FORMATS, open_exporter
+from enhanced_spelling_bee import find_spelling_bee_words, get_index, get_word_scores, iter_result_rows
+from process_pool import pool_context
+
+console = Console(stderr=True)
+
+PUZZLE_FIELDS = ("center", "others", "min_length", "max_length", "must_contain")
+
+def parse_args():
+    """
+    Parse command-line arguments for the batch solver.
+    Example usage:
+        python batch_solver.py puzzles.jsonl -d words_enable.sbd -o results.jsonl --workers 8
+        python batch_solver.py puzzles.csv -d words_enable.sbd --export words.parquet
+    """
+    parser = argparse.ArgumentParser(
+        description="Solve many Spelling Bee puzzles from a JSONL or CSV file in parallel."
+    )
+    parser.add_argument(
+        "input",
+        help="JSONL or CSV (by extension) with center, others and optional min_length, max_length, must_contain."
+    )
+    parser.add_argument(
+        "-d", "--dictionary",
+        default="words_enable.txt",
+        help="Path to dictionary file, text or compiled (default: words_enable.txt)."
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default=None,
+        help="Path of the JSONL results file, one line per puzzle (default: stdout unless --export is given)."
+    )
+    parser.add_argument(
+        "--export",
+        dest="export_path",
+        default=None,
+        help="Optional path of a flat table with one row per word and a puzzle_id column (.jsonl, .csv, .parquet, .arrow)."
+    )
+    parser.add_argument(
+        "--export-format",
+        choices=EXPORT_FORMATS,
+        default=None,
+        help="Format of --export (default: from its extension; parquet and arrow need pyarrow)."
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)."
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=0,
+        help="Keep only the best N words per puzzle (default: 0 = all)."
+    )
+    return parser.parse_args()
+
+# ------------------------ INPUT ------------------------
+
+def _puzzle_from_row(row: dict) -> dict:
+    return {
+        "center": str(row["center"]).strip().lower(),
+        "others": str(row["others"]).strip().lower(),
+        "min_length": int(row.get("min_length") or 4),
+        "max_length": int(row.get("max_length") or 0),
+        "must_contain": str(row.get("must_contain") or "").strip().lower(),
+    }
+
+def read_puzzles(path: str):
+    """
+    Yields puzzle dicts from a CSV file (with a header row) or a JSONL file
+    (one JSON object per line). Blank lines are skipped.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith(".csv"):
+            for row in csv.DictReader(f):
+                yield _puzzle_from_row(row)
+        else:
+            for line in f:
+                if line.strip():
+                    yield _puzzle_from_row(json.loads(line))
+
+# ------------------------ WORKERS ------------------------
+
+_WORKER_DICTIONARY = None
+_WORKER_LIMIT = 0
+
+def _init_worker(dictionary_path: str, limit: int):
+    """
+    Runs once per worker. With the fork start method the index and scores are
+    inherited from the parent and this is just a cache hit; otherwise each
+    worker loads them (cheap for a compiled dictionary, which is mmap'd).
+    """
+    global _WORKER_DICTIONARY, _WORKER_LIMIT
+    _WORKER_DICTIONARY = dictionary_path
+    _WORKER_LIMIT = limit
+    get_word_scores(get_index(dictionary_path))
+
+def solve_puzzle(puzzle: dict) -> dict:
+    """Solves one puzzle and returns it with its words, scores and pangrams."""
+    valid_words, letters_set = find_spelling_bee_words(
+        dictionary_path=_WORKER_DICTIONARY,
+        center=puzzle["center"],
+        other_letters=puzzle["others"],
+        min_length=puzzle["min_length"],
+        max_length=puzzle["max_length"],
+        must_contain=puzzle["must_contain"],
+        limit=_WORKER_LIMIT,
+    )
+    return dict(
+        puzzle,
+        total_words=len(valid_words),
+        words=[w for w, s in valid_words],
+        scores=[round(s, 2) for w, s in valid_words],
+        pangrams=[w for w, s, pangram in iter_result_rows(valid_words, letters_set) if pangram],
+    )
+
+def solve_batch(puzzles, dictionary_path: str, workers: int, limit: int = 0, chunksize: int = 64):
+    """
+    Solves an iterable of puzzles across a process pool and yields results in
+    input order. The dictionary index and word scores are loaded once in the
+    parent before the workers start.
+    """
+    _init_worker(dictionary_path, limit)
+    if workers <= 1:
+        yield from map(solve_puzzle, puzzles)
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context(),
+                             initializer=_init_worker, initargs=(dictionary_path, limit)) as executor:
+        yield from executor.map(solve_puzzle, puzzles, chunksize=chunksize)
+
+# ------------------------ OUTPUT ------------------------
+
+def export_result(exporter, puzzle_id, result: dict):
+    """Writes one solve_batch result as rows of a bulk exporter."""
+    words = result["words"]
+    pangrams = set(result["pangrams"])
+    exporter.write_columns(
+        puzzle_id,
+        words,
+        result["scores"],
+        [len(w) for w in words],
+        [w in pangrams for w in words],
+    )
+
+def main():
+    args = parse_args()
+    start = time.perf_counter()
+    solved = 0
+    output = args.output or ("-" if args.export_path is None else None)
+    out = None
+    exporter = None
+    try:
+        try:
+            if output == "-":
+                out = sys.stdout
+            elif output:
+                out = open(output, 'w', encoding='utf-8')
+            if args.export_path:
+                exporter = open_exporter(args.export_path, args.export_format)
+        except (ImportError, OSError, ValueError) as e:
+            console.print(f"[red]{e}[/red]")
+            sys.exit(1)
+        for result in solve_batch(read_puzzles(args.input), args.dictionary, args.workers, args.limit):
+            if out is not None:
+                out.write(json.dumps(result) + "\n")
+            if exporter is not None:
+                export_result(exporter, solved, result)
+            solved += 1
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+        if exporter is not None:
+            exporter.close()
+    elapsed = time.perf_counter() - start
+    rate = solved / elapsed if elapsed else 0.0
+    console.print(f"[green]Solved {solved} puzzles in {elapsed:.2f}s ({rate:.1f} puzzles/s) with {args.workers} workers.[/green]")
+    if exporter is not None:
+        console.print(f"[green]Exported {exporter.rows} rows for {exporter.puzzles} puzzles to {args.export_path}.[/green]")
+
+if __name__ == "__main__":
+    main()
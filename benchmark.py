@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from letter_index import LetterIndex
+from spelling_bee_helper import load_dictionary, is_valid_word
+
+console = Console()
+
+# Fixed puzzles ranging from sparse to very dense letter sets: (center, others)
+PUZZLES = [
+    ("x", "qzjkvw"),
+    ("a", "bcdefg"),
+    ("g", "filnoa"),
+    ("t", "oapcin"),
+    ("e", "rstlna"),
+    ("e", "ainrst"),
+]
+
+# Phases slower than baseline * (1 + threshold) fail the regression check, unless
+# the difference is below this noise floor.
+DEFAULT_REGRESSION_THRESHOLD = 0.25
+NOISE_FLOOR_MS = 0.05
+
+# Cumulative import time allowed for each module, as reported by 'python -X importtime'.
+IMPORT_BUDGETS_MS = {
+    "enhanced_spelling_bee": 200,
+    "cli": 250,
+}
+
+# Modules that must never be pulled in just by importing the app.
+HEAVY_MODULES = ("nltk",)
+
+def parse_args():
+    """
+    Parse command-line arguments for the benchmark.
+    Example usage:
+        python benchmark.py --dictionary words_enable.txt --repeat 20
+        python benchmark.py --suite --json bench.json --baseline bench_main.json
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for the Spelling Bee engines: lookup, scoring, import budget and the full phase suite."
+    )
+    parser.add_argument(
+        "-d", "--dictionary",
+        default="words_enable.txt",
+        help="Path to dictionary file (default: words_enable.txt)."
+    )
+    parser.add_argument(
+        "-r", "--repeat",
+        type=int,
+        default=10,
+        help="Number of timed runs per puzzle (default: 10)."
+    )
+    parser.add_argument(
+        "--scoring",
+        action="store_true",
+        help="Benchmark scalar vs. batch n-gram scoring of the whole dictionary instead of lookup."
+    )
+    parser.add_argument(
+        "--suite",
+        action="store_true",
+        help="Run the full phase-by-phase benchmark suite (import, load, filter, scoring, sort, render)."
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        default=None,
+        help="With --suite: write the results as JSON to this path for comparison across commits."
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="With --suite: JSON results of an earlier run; exit 1 if any phase regressed."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help=f"Allowed slowdown vs. the baseline as a fraction (default: {DEFAULT_REGRESSION_THRESHOLD})."
+    )
+    parser.add_argument(
+        "--check-import",
+        action="store_true",
+        help="Only check import times against IMPORT_BUDGETS_MS; exit 1 if any is over budget."
+    )
+    return parser.parse_args()
+
+def time_per_query(func, repeat: int) -> float:
+    """Returns the best wall time in milliseconds over 'repeat' calls of func()."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def scan_candidates(word_list, center, other_letters):
+    """The pre-index path: run is_valid_word over every dictionary entry."""
+    letters_set = set(center + other_letters)
+    return [word for word in word_list if is_valid_word(word, center, letters_set)]
+
+def bench_solve(dictionary_path: str, repeat: int):
+    """
+    Times candidate lookup for each benchmark puzzle with the linear scan and with
+    the letter-mask index, checking that both return identical results.
+    """
+    word_list = load_dictionary(dictionary_path)
+
+    start = time.perf_counter()
+    index = LetterIndex(word_list)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    table = Table(title="Candidate lookup latency (best of runs)")
+    table.add_column("Puzzle", justify="left", style="cyan")
+    table.add_column("Words", justify="right")
+    table.add_column("Scan (ms)", justify="right", style="magenta")
+    table.add_column("Index (ms)", justify="right", style="magenta")
+    table.add_column("Speedup", justify="right", style="green")
+
+    for center, others in PUZZLES:
+        expected = scan_candidates(word_list, center, others)
+        if index.candidates(center, others) != expected:
+            raise AssertionError(f"Index results differ from scan for {center}/{others}")
+
+        scan_ms = time_per_query(lambda: scan_candidates(word_list, center, others), repeat)
+        index_ms = time_per_query(lambda: index.candidates(center, others), repeat)
+        table.add_row(
+            f"{center.upper()} {others}",
+            str(len(expected)),
+            f"{scan_ms:.3f}",
+            f"{index_ms:.3f}",
+            f"{scan_ms / index_ms:.0f}x" if index_ms else "-",
+        )
+
+    console.print(f"Dictionary       : {dictionary_path} ({len(word_list)} words)", style="bold white")
+    console.print(f"Index build time : {build_ms:.1f} ms", style="bold white")
+    console.print(table)
+
+def bench_scoring(dictionary_path: str, repeat: int):
+    """
+    Times combined_score over every dictionary word one by one and through the
+    batch score_words path, checking that both give the same scores.
+    """
+    from enhanced_spelling_bee import combined_score, get_model, score_words
+
+    word_list = load_dictionary(dictionary_path)
+    model = get_model()
+    bigram_freq, trigram_freq = model.bigram_freq, model.trigram_freq
+
+    def scalar():
+        return [combined_score(w, bigram_freq, trigram_freq) for w in word_list]
+
+    expected = scalar()
+    actual = score_words(word_list, model)
+    worst = max((abs(a - b) for a, b in zip(actual, expected)), default=0.0)
+    if len(actual) != len(expected) or worst > 1e-9:
+        raise AssertionError(f"Batch scores differ from combined_score (max error {worst})")
+
+    scalar_ms = time_per_query(scalar, repeat)
+    batch_ms = time_per_query(lambda: score_words(word_list, model), repeat)
+
+    console.print(f"Dictionary       : {dictionary_path} ({len(word_list)} words)", style="bold white")
+    console.print(f"Scalar scoring   : {scalar_ms:.1f} ms", style="bold white")
+    console.print(f"Batch scoring    : {batch_ms:.1f} ms ({scalar_ms / batch_ms:.1f}x)", style="bold white")
+    console.print(f"Max difference   : {worst:.3g}", style="bold white")
+
+def measure_import_ms(module: str) -> float:
+    """
+    Imports 'module' in a fresh interpreter with -X importtime and returns its
+    cumulative import time in milliseconds. Also fails if the import loaded
+    the n-gram model or any of HEAVY_MODULES.
+    """
+    check = (
+        f"import sys, {module}; "
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]; "
+        f"assert not heavy, f'importing {module} pulled in {{heavy}}'; "
+        f"import enhanced_spelling_bee; "
+        f"assert enhanced_spelling_bee._MODEL is None, 'importing {module} loaded the n-gram model'"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise AssertionError(result.stderr.strip().splitlines()[-1])
+
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if name.strip() == module:
+                return int(cumulative) / 1000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+def check_import_budget(repeat: int = 3) -> bool:
+    """
+    Checks every module in IMPORT_BUDGETS_MS against its budget, using the best
+    of 'repeat' runs to smooth out noise. Returns True if all are within budget.
+    """
+    ok = True
+    for module, budget_ms in IMPORT_BUDGETS_MS.items():
+        best_ms = min(measure_import_ms(module) for _ in range(repeat))
+        within = best_ms <= budget_ms
+        ok = ok and within
+        style = "green" if within else "red"
+        console.print(f"[{style}]import {module:<22}: {best_ms:7.1f} ms (budget {budget_ms} ms)[/{style}]")
+    return ok
+
+# ------------------------ SUITE ------------------------
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+@contextlib.contextmanager
+def _quiet(module):
+    """Temporarily points a module's rich console at an in-memory buffer."""
+    original = module.console
+    module.console = Console(file=io.StringIO(), width=120)
+    try:
+        yield
+    finally:
+        module.console = original
+
+def run_suite(dictionary_path: str, repeat: int) -> dict:
+    """
+    Times every phase of a solve separately for both engines on the fixed
+    PUZZLES and returns {"meta": ..., "metrics": {name: best ms}}. Caches are
+    bypassed: each phase calls the underlying function directly.
+    """
+    import enhanced_spelling_bee as enhanced
+    import spelling_bee_helper as helper
+    from compiled_dictionary import CompiledDictionary, compile_dictionary
+    from ngram_model import load_model
+
+    metrics = {}
+    for module in ("enhanced_spelling_bee", "spelling_bee_helper"):
+        metrics[f"import.{module}"] = min(measure_import_ms(module) for _ in range(3))
+
+    metrics["load.model"] = time_per_query(load_model, repeat)
+    metrics["load.text"] = time_per_query(lambda: LetterIndex(enhanced.load_dictionary(dictionary_path)), max(1, repeat // 5))
+    with tempfile.TemporaryDirectory() as tmp:
+        compiled_path = os.path.join(tmp, "dictionary.sbd")
+        compile_dictionary(dictionary_path, compiled_path)
+        metrics["load.compiled"] = time_per_query(lambda: CompiledDictionary(compiled_path), repeat)
+
+    index = LetterIndex(enhanced.load_dictionary(dictionary_path))
+    model = enhanced.get_model()
+    metrics["score.dictionary"] = time_per_query(lambda: enhanced.score_words(index.words, model), max(1, repeat // 5))
+    scores = enhanced.get_word_scores(index)
+
+    for center, others in PUZZLES:
+        name = f"{center}{others}"
+        letters_set = set(center + others)
+        indices = index.candidate_indices(center, others)
+        words = [index.words[i] for i in indices]
+        scored = [(index.words[i], scores[i]) for i in indices]
+        ranked = sorted(scored, key=enhanced._result_order)
+        normalized = enhanced.normalize_scores(ranked)
+
+        metrics[f"enhanced.filter.{name}"] = time_per_query(lambda: index.candidate_indices(center, others), repeat)
+        metrics[f"enhanced.score.{name}"] = time_per_query(lambda: enhanced.score_words(words, model), repeat)
+        metrics[f"enhanced.sort.{name}"] = time_per_query(lambda: sorted(scored, key=enhanced._result_order), repeat)
+        metrics[f"enhanced.normalize.{name}"] = time_per_query(lambda: enhanced.normalize_scores(ranked), repeat)
+        with _quiet(enhanced):
+            metrics[f"enhanced.render.{name}"] = time_per_query(
+                lambda: enhanced.print_results(normalized, letters_set, dictionary_path, 4, 0, "", center), repeat)
+
+        metrics[f"helper.score.{name}"] = time_per_query(
+            lambda: [(w, helper.compute_score(w, letters_set)) for w in words], repeat)
+        with _quiet(helper):
+            # The helper solves through the engine; drop its cached answers so
+            # every call is a full solve on the already loaded index.
+            def helper_solve():
+                enhanced.RESULT_CACHE.clear()
+                enhanced.CANDIDATE_CACHE.clear()
+                helper.find_spelling_bee_words(dictionary_path, center, others)
+            metrics[f"helper.solve.{name}"] = time_per_query(helper_solve, repeat)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dictionary": dictionary_path,
+            "words": len(index),
+            "repeat": repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "metrics": metrics,
+    }
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float) -> list:
+    """Returns (name, baseline ms, current ms) for every phase that regressed."""
+    regressions = []
+    for name, before in baseline.get("metrics", {}).items():
+        after = results["metrics"].get(name)
+        if after is not None and after > before * (1 + threshold) and after - before > NOISE_FLOOR_MS:
+            regressions.append((name, before, after))
+    return regressions
+
+def print_suite(results: dict, baseline: dict = None):
+    table = Table(title=f"Benchmark suite ({results['meta']['commit'] or 'working tree'})")
+    table.add_column("Phase", justify="left", style="cyan", no_wrap=True)
+    table.add_column("Best (ms)", justify="right", style="magenta")
+    if baseline:
+        table.add_column("Baseline (ms)", justify="right")
+        table.add_column("Change", justify="right", style="green")
+    for name, ms in results["metrics"].items():
+        row = [name, f"{ms:.3f}"]
+        if baseline:
+            before = baseline.get("metrics", {}).get(name)
+            row += [f"{before:.3f}", f"{(ms - before) / before:+.0%}" if before else "-"] if before is not None else ["-", "-"]
+        table.add_row(*row)
+    console.print(table)
+
+def main():
+    args = parse_args()
+    if args.check_import:
+        sys.exit(0 if check_import_budget() else 1)
+    if args.suite:
+        results = run_suite(args.dictionary, args.repeat)
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        print_suite(results, baseline)
+        if args.json_path:
+            with open(args.json_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+            console.print(f"\n[green]Results successfully written to {args.json_path}![/green]")
+        if baseline:
+            regressions = compare_to_baseline(results, baseline, args.threshold)
+            for name, before, after in regressions:
+                console.print(f"[red]Regression: {name} {before:.3f} ms -> {after:.3f} ms[/red]")
+            sys.exit(1 if regressions else 0)
+        return
+    if args.scoring:
+        bench_scoring(args.dictionary, args.repeat)
+    else:
+        bench_solve(args.dictionary, args.repeat)
+
+if __name__ == "__main__":
+    main()
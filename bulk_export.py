@@ -0,0 +1,193 @@
+import csv
+import json
+import os
+from json.encoder import encode_basestring_ascii
+
+from letter_index import letter_mask
+from solve_result import SolveResult
+
+# Exports are flat tables with one row per (puzzle, word):
+#   puzzle_id, word, score, length, pangram
+# Length and pangram are computed once per word (pangram by comparing letter
+# masks), and rows are handed to the file in large batches. Scores are
+# rounded to SCORE_DIGITS so float32 noise doesn't reach the file.
+
+EXPORT_FORMATS = ("jsonl", "csv", "parquet", "arrow")
+EXPORT_COLUMNS = ("puzzle_id", "word", "score", "length", "pangram")
+
+BUFFER_BYTES = 1024 * 1024
+ROW_GROUP_ROWS = 64 * 1024
+SCORE_DIGITS = 2
+
+def export_format(path: str) -> str:
+    """Infers the export format from a file extension (.jsonl, .csv, .parquet, .arrow/.feather)."""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension in ("jsonl", "ndjson", "json"):
+        return "jsonl"
+    if extension in ("arrow", "feather", "ipc"):
+        return "arrow"
+    if extension in EXPORT_FORMATS:
+        return extension
+    raise ValueError(f"cannot tell the export format of {path}; use one of {', '.join(EXPORT_FORMATS)}")
+
+def puzzle_columns(valid_words, letters_set):
+    """
+    Splits (word, score) results into (words, scores, lengths, pangrams)
+    columns for ResultExporter.write_columns. A SolveResult already holds
+    them and is only unpacked.
+    """
+    if isinstance(valid_words, SolveResult):
+        return ([valid_words.word(k) for k in range(len(valid_words))],
+                [round(valid_words.score(k), SCORE_DIGITS) for k in range(len(valid_words))],
+                list(valid_words.lengths),
+                [valid_words.is_pangram(k) for k in range(len(valid_words))])
+    puzzle_mask = letter_mask("".join(letters_set))
+    words = [w for w, _ in valid_words]
+    scores = [round(s, SCORE_DIGITS) for _, s in valid_words]
+    lengths = [len(w) for w in words]
+    if puzzle_mask > 0:
+        pangrams = [letter_mask(w) == puzzle_mask for w in words]
+    else:
+        pangrams = [all(letter in w for letter in letters_set) for w in words]
+    return words, scores, lengths, pangrams
+
+class ResultExporter:
+    """
+    Writes the results of many puzzles into one file. Use as a context manager:
+
+        with open_exporter("results.parquet") as exporter:
+            exporter.write_puzzle(puzzle_id, valid_words, letters_set)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows = 0
+        self.puzzles = 0
+
+    def write_puzzle(self, puzzle_id, valid_words, letters_set):
+        """Writes one puzzle's (word, score) results."""
+        self.write_columns(puzzle_id, *puzzle_columns(valid_words, letters_set))
+
+    def write_columns(self, puzzle_id, words, scores, lengths, pangrams):
+        """Writes one puzzle from precomputed, equal-length columns."""
+        self._write(puzzle_id, words, scores, lengths, pangrams)
+        self.rows += len(words)
+        self.puzzles += 1
+
+    def _write(self, puzzle_id, words, scores, lengths, pangrams):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class JsonlExporter(ResultExporter):
+    """One JSON object per row, formatted from a template and written per puzzle."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, 'w', encoding='utf-8', buffering=BUFFER_BYTES)
+
+    def _write(self, puzzle_id, words, scores, lengths, pangrams):
+        head = '{"puzzle_id":' + json.dumps(puzzle_id) + ',"word":'
+        self._file.write("".join([
+            f'{head}{encode_basestring_ascii(w)},"score":{round(s, SCORE_DIGITS)!r},"length":{n},"pangram":{"true" if p else "false"}}}\n'
+            for w, s, n, p in zip(words, scores, lengths, pangrams)
+        ]))
+
+    def close(self):
+        self._file.close()
+
+class CsvExporter(ResultExporter):
+    """CSV with a header row; pangram is written as Yes/No like export_to_csv."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, 'w', encoding='utf-8', newline='', buffering=BUFFER_BYTES)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(EXPORT_COLUMNS)
+
+    def _write(self, puzzle_id, words, scores, lengths, pangrams):
+        self._writer.writerows(
+            zip([puzzle_id] * len(words), words, scores, lengths, ["Yes" if p else "No" for p in pangrams]))
+
+    def close(self):
+        self._file.close()
+
+class ArrowExporter(ResultExporter):
+    """
+    Parquet or Arrow IPC file via pyarrow. Rows are collected column-wise and
+    written as one record batch (row group) per ROW_GROUP_ROWS rows.
+    """
+
+    def __init__(self, path: str, file_format: str):
+        super().__init__(path)
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(f"{file_format} export requires pyarrow (pip install pyarrow)")
+        self._pa = pa
+        self._file_format = file_format
+        self._writer = None
+        self._sink = None
+        self._buffer = {name: [] for name in EXPORT_COLUMNS}
+        self._buffered = 0
+
+    def _write(self, puzzle_id, words, scores, lengths, pangrams):
+        buffer = self._buffer
+        buffer["puzzle_id"].extend([puzzle_id] * len(words))
+        buffer["word"].extend(words)
+        buffer["score"].extend(scores)
+        buffer["length"].extend(lengths)
+        buffer["pangram"].extend(pangrams)
+        self._buffered += len(words)
+        if self._buffered >= ROW_GROUP_ROWS:
+            self._flush()
+
+    def _flush(self):
+        pa = self._pa
+        table = pa.table({
+            "puzzle_id": self._buffer["puzzle_id"],
+            "word": pa.array(self._buffer["word"], type=pa.string()),
+            "score": pa.array(self._buffer["score"], type=pa.float64()),
+            "length": pa.array(self._buffer["length"], type=pa.uint8()),
+            "pangram": pa.array(self._buffer["pangram"], type=pa.bool_()),
+        })
+        if self._writer is None:
+            # The first row group fixes the schema; later ones are cast to it.
+            self._schema = table.schema
+            if self._file_format == "parquet":
+                import pyarrow.parquet as pq
+                self._writer = pq.ParquetWriter(self.path, self._schema)
+            else:
+                self._sink = pa.OSFile(self.path, 'wb')
+                self._writer = pa.ipc.new_file(self._sink, self._schema)
+        self._writer.write_table(table.cast(self._schema))
+        self._buffer = {name: [] for name in EXPORT_COLUMNS}
+        self._buffered = 0
+
+    def close(self):
+        if self._buffered or self._writer is None:
+            self._flush()
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+def open_exporter(path: str, file_format: str = None) -> ResultExporter:
+    """
+    Opens a bulk exporter for 'path'. The format is inferred from the extension
+    unless given. Parquet and Arrow raise ImportError without pyarrow.
+    """
+    file_format = file_format or export_format(path)
+    if file_format == "jsonl":
+        return JsonlExporter(path)
+    if file_format == "csv":
+        return CsvExporter(path)
+    if file_format in ("parquet", "arrow"):
+        return ArrowExporter(path, file_format)
+    raise ValueError(f"unknown export format {file_format!r}; expected one of {', '.join(EXPORT_FORMATS)}")
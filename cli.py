@@ -1,15 +1,56 @@
+import argparse
+import functools
+import os
+
 from rich.console import Console
-from enhanced_spelling_bee import find_spelling_bee_words, print_results, export_to_csv
+from dictionary_set import parse_dictionary_paths
+from enhanced_spelling_bee import SCORING_MODES, find_spelling_bee_words, print_results, print_profile, export_to_csv, warm_model
+from enhanced_spelling_bee import puzzle_ranks, source_tagger
+from solve_profile import SolveProfile
+import solve_client
 
 console = Console()
 
 def get_user_input(prompt, default):
     return console.input(f"{prompt} [default: {default}]: ").strip() or default
 
-def interactive_mode():
+def get_solver(server_url=None, scoring="ngram"):
+    """
+    Returns the (find_spelling_bee_words, puzzle_ranks) pair to use: those of a
+    running solve server (server_url, or the SPELLING_BEE_SERVER environment
+    variable) if it answers, otherwise the local engine, whose model is then
+    warmed in the background while the user types the letters.
+    """
+    server_url = server_url or os.environ.get("SPELLING_BEE_SERVER")
+    if server_url:
+        if solve_client.server_available(server_url):
+            console.print(f"[green]Using solve server at {server_url}[/green]")
+            return (functools.partial(solve_client.find_spelling_bee_words, server_url),
+                    functools.partial(solve_client.puzzle_ranks, server_url))
+        console.print(f"[yellow]Solve server at {server_url} is not reachable; solving locally.[/yellow]")
+    if scoring == "ngram":
+        warm_model()
+    return find_spelling_bee_words, puzzle_ranks
+
+def interactive_mode(server_url=None, prefix="", suffix="", pattern="",
+                     profile=False, profile_memory=False, pstats_path=None, scoring="ngram",
+                     require=(), exclude=(), history_dir=None):
     """
     Runs an interactive session to collect user inputs and display Spelling Bee results.
+    prefix, suffix and pattern ('?' = one letter, '*' = any run) further
+    restrict every query. scoring picks n-gram scores or NYT points (with the
+    puzzle's Genius and Queen Bee thresholds).
+    Several comma-separated dictionaries are solved together, each word tagged
+    with its sources; require/exclude keep only words in all of / none of the
+    given dictionaries.
+    With profile=True each query prints a per-phase timing table
+    (profile_memory adds peak memory, pstats_path writes cProfile output).
+    With history_dir, every puzzle is recorded in that puzzle history.
     """
+    solve, rank_puzzle = get_solver(server_url, scoring)
+    if profile and solve is not find_spelling_bee_words:
+        console.print("[yellow]Profiling only covers local solves; rendering is still timed.[/yellow]")
+
     console.print("[bold yellow]Welcome to the Enhanced Spelling Bee Helper![/bold yellow]\n")
 
     # Default inputs
@@ -19,30 +60,174 @@ def interactive_mode():
     default_min_length = 4
     default_max_length = 12
     default_must_contain = ""
+    default_limit = 0
+    default_page_size = 50
 
-    dictionary_path = get_user_input("Enter path to dictionary file", default_dictionary_path)
+    dictionary_path = parse_dictionary_paths(
+        get_user_input("Enter path to dictionary file (comma-separate several)", default_dictionary_path))
+    if require or exclude:
+        # The membership filters pick from the loaded set, so load those dictionaries too.
+        paths = (dictionary_path,) if isinstance(dictionary_path, str) else dictionary_path
+        dictionary_path = tuple(dict.fromkeys(paths + tuple(require) + tuple(exclude)))
+    sources = None
+    if isinstance(dictionary_path, tuple):
+        if solve is not find_spelling_bee_words:
+            console.print("[yellow]Combined dictionaries are solved locally.[/yellow]")
+            solve, rank_puzzle = find_spelling_bee_words, puzzle_ranks
+        sources = source_tagger(dictionary_path)
     center = get_user_input("Enter the center letter (required)", default_center).lower()
     other_letters = get_user_input("Enter the other 6 letters (required)", default_other_letters).lower()
     min_length = int(get_user_input("Minimum word length?", default_min_length))
     max_length = int(get_user_input("Maximum word length? [0 = no limit]", default_max_length))
     must_contain = get_user_input("Must contain substring (optional)", default_must_contain).lower()
+    limit = int(get_user_input("Show only the top N words? [0 = all]", default_limit))
+    page_size = int(get_user_input("Rows per page? [0 = no paging]", default_page_size))
+
+    ranks = None
+    if scoring == "nyt" and rank_puzzle is not puzzle_ranks:
+        # Ask the server too, so the client never loads the dictionary.
+        try:
+            ranks = rank_puzzle(dictionary_path, center, other_letters)
+        except OSError as e:
+            console.print(f"[yellow]{e}; looking up the ranks locally.[/yellow]")
+
+    if history_dir:
+        # Record the full puzzle, not just the words the filters let through,
+        # and only once: follow-up queries below change the filters, not the letters.
+        from puzzle_history import PuzzleHistory
+        solution, _ = find_spelling_bee_words(dictionary_path, center, other_letters, scoring="nyt")
+        try:
+            number = PuzzleHistory(history_dir).append(center, other_letters, solution)
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Could not record the puzzle in {history_dir}: {e}[/red]")
+        else:
+            console.print(f"[green]Recorded puzzle #{number} in {history_dir}[/green]")
 
     while True:
-        valid_words, letters_set = find_spelling_bee_words(
+        query_profile = SolveProfile(track_memory=profile_memory, cprofile_path=pstats_path) if profile else None
+        # Profiling and dictionary sets are only available in the local engine.
+        extra = {}
+        if solve is find_spelling_bee_words:
+            extra = {"profile": query_profile, "require": require, "exclude": exclude}
+        valid_words, letters_set = solve(
             dictionary_path=dictionary_path,
             center=center,
             other_letters=other_letters,
             min_length=min_length,
             max_length=max_length,
             must_contain=must_contain,
+            limit=limit,
+            prefix=prefix,
+            suffix=suffix,
+            pattern=pattern,
+            scoring=scoring,
+            **extra,
         )
 
-        print_results(valid_words, letters_set, dictionary_path, min_length, max_length, must_contain, center)
+        print_results(valid_words, letters_set, dictionary_path, min_length, max_length, must_contain, center,
+                      page_size=page_size, prefix=prefix, suffix=suffix, pattern=pattern, profile=query_profile,
+                      scoring=scoring, sources=sources, ranks=ranks)
+        if query_profile is not None:
+            print_profile(query_profile)
 
         if get_user_input("Export to CSV? (y/n)", "n").lower().startswith("y"):
             csv_path = get_user_input("Enter CSV file name", "results.csv")
-            export_to_csv(valid_words, letters_set, csv_path)
+            export_to_csv(valid_words, letters_set, csv_path, sources=sources)
 
         if get_user_input("Do you want to run another query? (y/n)", "y").lower().startswith("n"):
             console.print("\n[bold green]Goodbye![/bold green]")
             break
+
+        # Same puzzle with adjusted filters. Tightening them (a higher minimum,
+        # a lower maximum, a longer substring) only filters the previous
+        # candidates instead of rescanning the dictionary.
+        min_length = int(get_user_input("Minimum word length?", min_length))
+        max_length = int(get_user_input("Maximum word length? [0 = no limit]", max_length))
+        must_contain = get_user_input("Must contain substring ('-' = none)", must_contain or "-").lower()
+        must_contain = "" if must_contain == "-" else must_contain
+        limit = int(get_user_input("Show only the top N words? [0 = all]", limit))
+
+def parse_args():
+    """
+    Parse command-line arguments for the interactive helper.
+    Example usage:
+        python cli.py --prefix re
+        python cli.py --pattern "?a??ing" --server http://127.0.0.1:8765
+        python cli.py --profile --profile-memory --pstats solve.pstats
+        python cli.py --scoring nyt
+        python cli.py --require words_enable.txt --exclude words_alpha.txt
+        python cli.py --history history/
+    """
+    parser = argparse.ArgumentParser(
+        description="Interactive Spelling Bee helper with n-gram scoring."
+    )
+    parser.add_argument("--prefix", default="", help="Only show words starting with this text.")
+    parser.add_argument("--suffix", default="", help="Only show words ending with this text.")
+    parser.add_argument(
+        "--pattern",
+        default="",
+        help="Only show words matching this pattern ('?' = one letter, '*' = any run), e.g. '?a??ing'."
+    )
+    parser.add_argument(
+        "--server",
+        default=None,
+        help="URL of a running solve_server.py (default: $SPELLING_BEE_SERVER, else solve locally)."
+    )
+    parser.add_argument(
+        "--scoring",
+        choices=SCORING_MODES,
+        default="ngram",
+        help="Score words by n-gram frequency (0-100) or by NYT points with rank thresholds (default: ngram)."
+    )
+    parser.add_argument(
+        "--require",
+        action="append",
+        default=[],
+        help="Only show words that are in this dictionary too; may be repeated."
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        help="Hide words that are in this dictionary; may be repeated."
+    )
+    parser.add_argument(
+        "--history",
+        default=None,
+        help="Record every solved puzzle in this history directory (query it with puzzle_history.py)."
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print wall time and candidate counts for each solve phase after every query."
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="With --profile, also record peak memory per phase (tracemalloc; slower)."
+    )
+    parser.add_argument(
+        "--pstats",
+        default=None,
+        help="With --profile, write cProfile stats of each solve to this file (view with python -m pstats)."
+    )
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    interactive_mode(
+        server_url=args.server,
+        prefix=args.prefix.lower(),
+        suffix=args.suffix.lower(),
+        pattern=args.pattern.lower(),
+        profile=args.profile or args.profile_memory or bool(args.pstats),
+        profile_memory=args.profile_memory,
+        pstats_path=args.pstats,
+        scoring=args.scoring,
+        require=tuple(args.require),
+        exclude=tuple(args.exclude),
+        history_dir=args.history,
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+
+import argparse
+import bisect
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+
+from rich.console import Console
+
+from letter_index import LetterIndex, derived_nbytes, letter_mask
+
+console = Console()
+
+# ------------------------ FILE FORMAT ------------------------
+#
+# header   : magic, format version, flags, word count, bucket count, order length,
+#            blob size, score tag (digest of the model the scores came from)
+# sections : each starts on an 8-byte boundary, all little-endian
+#   offsets       uint32 * (words + 1)   byte offset of each word in the blob
+#   masks         uint32 * words         letter mask (0 = contains non a-z)
+#   lengths       uint8  * words         word length in characters (capped at 255)
+#   bucket_masks  uint32 * buckets       distinct non-zero masks, ascending
+#   bucket_starts uint32 * (buckets + 1) start of each bucket in 'order'
+#   order         uint32 * order length  word ids grouped by mask, ascending within a bucket
+#   scores        float64 * words        only if FLAG_SCORES is set
+#   blob          utf-8 words, back to back
+
+COMPILED_MAGIC = b"SBDC"
+COMPILED_VERSION = 1
+FLAG_SCORES = 1
+
+_HEADER = struct.Struct("<4sHHIIIQ16s")
+
+def is_compiled_dictionary(path: str) -> bool:
+    """Returns True if 'path' starts with the compiled dictionary magic bytes."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(COMPILED_MAGIC)) == COMPILED_MAGIC
+    except OSError:
+        return False
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+# ------------------------ COMPILING ------------------------
+
+def compile_dictionary(source_path: str, output_path: str, scorer=None, score_tag: str = ""):
+    """
+    Compiles a word-list text file into the memory-mappable format.
+
+    Words are read exactly as the text loader reads them (stripped, lowercased,
+    blank lines skipped) and keep their order. If 'scorer' is given, scorer(word)
+    is stored for every word and 'score_tag' (e.g. the model digest) records
+    which model produced the scores.
+    """
+    with open(source_path, 'r', encoding='utf-8') as f:
+        words = [w.strip().lower() for w in f if w.strip()]
+
+    encoded = [w.encode('utf-8') for w in words]
+    offsets = array("I", [0])
+    for e in encoded:
+        offsets.append(offsets[-1] + len(e))
+    masks = array("I", (max(letter_mask(w), 0) for w in words))
+    lengths = array("B", (min(len(w), 255) for w in words))
+
+    buckets = {}
+    for i, mask in enumerate(masks):
+        if mask:
+            buckets.setdefault(mask, []).append(i)
+    bucket_masks = array("I", sorted(buckets))
+    bucket_starts = array("I", [0])
+    order = array("I")
+    for mask in bucket_masks:
+        order.extend(buckets[mask])
+        bucket_starts.append(len(order))
+
+    sections = [offsets, masks, lengths, bucket_masks, bucket_starts, order]
+    flags = 0
+    if scorer is not None:
+        sections.append(array("d", (scorer(w) for w in words)))
+        flags |= FLAG_SCORES
+    blob = b"".join(encoded)
+
+    tag = score_tag.encode('ascii')[:16].ljust(16, b"\0")
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(COMPILED_MAGIC, COMPILED_VERSION, flags, len(words),
+                             len(bucket_masks), len(order), len(blob), tag))
+        for section in sections + [blob]:
+            f.write(b"\0" * (_align(f.tell()) - f.tell()))
+            f.write(section if isinstance(section, bytes) else _little_endian(section))
+    os.replace(tmp_path, output_path)
+    return len(words)
+
+# ------------------------ LOADING ------------------------
+
+class CompiledWords:
+    """
+    Read-only sequence of the words in a compiled dictionary. Words are decoded
+    from the mapped blob on access, so nothing is materialized up front.
+    """
+
+    def __init__(self, blob: memoryview, offsets: memoryview):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return str(self._blob[self._offsets[i]:self._offsets[i + 1]], 'utf-8')
+
+    def __iter__(self):
+        blob, offsets = self._blob, self._offsets
+        for i in range(len(offsets) - 1):
+            yield str(blob[offsets[i]:offsets[i + 1]], 'utf-8')
+
+class CompiledDictionary(LetterIndex):
+    """
+    A LetterIndex backed by a memory-mapped compiled dictionary file.
+
+    Opening is constant time regardless of dictionary size: the masks, lengths,
+    buckets and (optional) scores are views into the mapped file, and pages are
+    shared between processes that map the same file.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{path} is not a compiled dictionary")
+        magic, version, flags, count, bucket_count, order_len, blob_size, tag = _HEADER.unpack_from(self._mmap)
+        if magic != COMPILED_MAGIC:
+            raise ValueError(f"{path} is not a compiled dictionary")
+        if version != COMPILED_VERSION:
+            raise ValueError(f"{path} has format version {version}, expected {COMPILED_VERSION}; recompile it")
+        if sys.byteorder == "big":
+            raise ValueError("compiled dictionaries are little-endian only")
+
+        self.path = path
+        self.score_tag = tag.rstrip(b"\0").decode('ascii')
+        view = memoryview(self._mmap)
+        offset = _HEADER.size
+
+        def section(fmt, itemsize, n):
+            nonlocal offset
+            start = _align(offset)
+            offset = start + itemsize * n
+            if offset > len(view):
+                raise ValueError(f"{path} is truncated")
+            return view[start:offset].cast(fmt)
+
+        offsets = section("I", 4, count + 1)
+        self.masks = section("I", 4, count)
+        self.lengths = section("B", 1, count)
+        self.bucket_masks = section("I", 4, bucket_count)
+        self.bucket_starts = section("I", 4, bucket_count + 1)
+        self.order = section("I", 4, order_len)
+        self.scores = section("d", 8, count) if flags & FLAG_SCORES else None
+        blob = section("B", 1, blob_size)
+        self.words = CompiledWords(blob, offsets)
+        self.mask_aggregates = None
+
+    def nbytes(self) -> int:
+        # Mapped pages belong to the OS page cache, not this process; scores
+        # computed after loading and mask aggregates live on the heap.
+        size = sys.getsizeof(self) + derived_nbytes(self)
+        if isinstance(self.scores, array):
+            size += sys.getsizeof(self.scores)
+        return size
+
+    def bucket(self, mask: int):
+        i = bisect.bisect_left(self.bucket_masks, mask)
+        if i == len(self.bucket_masks) or self.bucket_masks[i] != mask:
+            return ()
+        return self.order[self.bucket_starts[i]:self.bucket_starts[i + 1]]
+
+# ------------------------ COMMAND LINE ------------------------
+
+def parse_args():
+    """
+    Parse command-line arguments for the dictionary compiler.
+    Example usage:
+        python compiled_dictionary.py compile words_enable.txt -o words_enable.sbd --scores
+        python compiled_dictionary.py info words_enable.sbd
+    """
+    parser = argparse.ArgumentParser(
+        description="Compile a word list into a memory-mappable dictionary file."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compile_cmd = subparsers.add_parser("compile", help="Compile a word-list text file.")
+    compile_cmd.add_argument("source", help="Word-list text file, one word per line.")
+    compile_cmd.add_argument(
+        "-o", "--output",
+        default=None,
+        help="Output path (default: source with a .sbd extension)."
+    )
+    compile_cmd.add_argument(
+        "--scores",
+        action="store_true",
+        help="Precompute the n-gram combined_score of every word into the file."
+    )
+
+    info = subparsers.add_parser("info", help="Print a summary of a compiled dictionary.")
+    info.add_argument("path", help="Compiled dictionary file.")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.command == "compile":
+        output = args.output or os.path.splitext(args.source)[0] + ".sbd"
+        scorer, tag = None, ""
+        if args.scores:
+            from enhanced_spelling_bee import combined_score, get_model
+            scorer, tag = combined_score, get_model().digest
+        start = time.perf_counter()
+        count = compile_dictionary(args.source, output, scorer=scorer, score_tag=tag)
+        console.print(f"[green]Compiled {count} words to {output} in {time.perf_counter() - start:.1f}s.[/green]")
+    else:
+        compiled = CompiledDictionary(args.path)
+        console.print(f"Compiled file    : {args.path}", style="bold white")
+        console.print(f"Words            : {len(compiled)}", style="bold white")
+        console.print(f"Letter buckets   : {len(compiled.bucket_masks)}", style="bold white")
+        console.print(f"Scores           : {compiled.score_tag or 'No'}" if compiled.scores is not None else "Scores           : No", style="bold white")
+        console.print(f"File size        : {os.path.getsize(args.path)} bytes", style="bold white")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+def file_signature(path):
+    """
+    Returns (resolved path, (mtime_ns, size)) for a file. For a tuple of paths
+    (a dictionary set) returns the tuple of resolved paths and the tuple of
+    their signatures.
+    Raises OSError if a file cannot be stat'ed.
+    """
+    if isinstance(path, tuple):
+        signatures = [file_signature(p) for p in path]
+        return tuple(r for r, _ in signatures), tuple(s for _, s in signatures)
+    resolved = os.path.realpath(path)
+    st = os.stat(resolved)
+    return resolved, (st.st_mtime_ns, st.st_size)
+
+class DictionaryCache:
+    """
+    LRU cache of loaded dictionaries keyed by resolved path (or tuple of
+    resolved paths for a combined dictionary set).
+
+    Each entry remembers the (mtime, size) of the file it was loaded from and is
+    reloaded when the file changes. Entries are evicted least-recently-used first
+    once their estimated sizes exceed max_bytes; the entry being returned is never
+    evicted, so a single dictionary larger than the cap still works.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # resolved path -> (signature, value, nbytes)
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, path: str, loader, sizeof):
+        """
+        Returns the cached value for 'path', calling loader(resolved_path) to
+        (re)load it on a miss. sizeof(value) estimates its memory in bytes.
+        Errors from stat or the loader propagate and nothing is cached.
+        """
+        resolved, signature = file_signature(path)
+        with self._lock:
+            entry = self._entries.get(resolved)
+            if entry is not None:
+                if entry[0] == signature:
+                    self.hits += 1
+                    self._entries.move_to_end(resolved)
+                    return entry[1]
+                self.invalidations += 1
+                self._remove(resolved)
+
+            self.misses += 1
+            value = loader(resolved)
+            nbytes = sizeof(value)
+            self._entries[resolved] = (signature, value, nbytes)
+            self._total_bytes += nbytes
+            self._evict(keep=resolved)
+            return value
+
+    def update_size(self, value, nbytes: int):
+        """
+        Re-records the size of a cached value after more data was attached to
+        it (scores, derived indexes), evicting other entries if that puts the
+        cache over max_bytes. Does nothing if 'value' is not cached.
+        """
+        with self._lock:
+            for resolved, (signature, cached, old_nbytes) in self._entries.items():
+                if cached is value:
+                    self._entries[resolved] = (signature, cached, nbytes)
+                    self._total_bytes += nbytes - old_nbytes
+                    self._evict(keep=resolved)
+                    return
+
+    def peek(self, path: str):
+        """
+        Returns the cached value for 'path' if it is loaded and still current,
+        without touching LRU order or counters; otherwise None.
+        """
+        try:
+            resolved, signature = file_signature(path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(resolved)
+            return entry[1] if entry is not None and entry[0] == signature else None
+
+    def _remove(self, resolved: str):
+        _, _, nbytes = self._entries.pop(resolved)
+        self._total_bytes -= nbytes
+
+    def _evict(self, keep: str):
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                self._entries.move_to_end(oldest)
+                continue
+            self._remove(oldest)
+            self.evictions += 1
+
+    def resize(self, max_bytes: int):
+        """Changes the memory cap, evicting entries if needed."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            if self._entries:
+                self._evict(keep=next(reversed(self._entries)))
+
+    def clear(self):
+        """Drops every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> dict:
+        """Returns a snapshot of the cache counters and contents."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "paths": list(self._entries),
+            }
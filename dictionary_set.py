@@ -0,0 +1,83 @@
+import os
+import sys
+from array import array
+
+from letter_index import LetterIndex
+
+MAX_SOURCES = 32
+
+def parse_dictionary_paths(text: str):
+    """
+    Splits a comma-separated list of dictionary paths. Returns a single path
+    unchanged, or a tuple of paths for a DictionarySet.
+    """
+    paths = [p.strip() for p in text.split(",") if p.strip()]
+    if len(paths) == 1:
+        return paths[0]
+    return tuple(paths)
+
+def source_label(path: str) -> str:
+    """Short name of a dictionary in result tags: its file name without extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+class DictionarySet(LetterIndex):
+    """
+    Several dictionaries merged into one deduplicated LetterIndex.
+
+    Every distinct word is stored (and interned) once, with a membership bitset
+    whose bit k is set if the word appears in sources[k]. Letter masks, buckets,
+    scores and mask aggregates are built once for the union, so a single
+    solve covers every dictionary and set algebra ("in A but not B", "in all of
+    them") is a bit test per candidate.
+    """
+
+    def __init__(self, sources):
+        """sources: list of (path, words) pairs, at most MAX_SOURCES."""
+        if len(sources) > MAX_SOURCES:
+            raise ValueError(f"at most {MAX_SOURCES} dictionaries can be combined")
+        self.sources = [os.path.realpath(path) for path, _ in sources]
+        self.labels = [source_label(path) for path, _ in sources]
+        self.ids = {}
+        words = []
+        membership = array("I")
+        for bit, (_, source_words) in enumerate(sources):
+            flag = 1 << bit
+            for word in source_words:
+                i = self.ids.get(word)
+                if i is None:
+                    i = self.ids[word] = len(words)
+                    words.append(sys.intern(word))
+                    membership.append(0)
+                membership[i] |= flag
+        self.membership = membership
+        super().__init__(words)
+
+    def nbytes(self) -> int:
+        size = super().nbytes()
+        size += sys.getsizeof(self.ids) + self.membership.itemsize * len(self.membership)
+        return size
+
+    def source_bits(self, paths) -> int:
+        """
+        Returns the membership bits of the given dictionaries. Raises ValueError
+        for a path that is not part of this set.
+        """
+        bits = 0
+        for path in paths:
+            try:
+                bits |= 1 << self.sources.index(os.path.realpath(path))
+            except ValueError:
+                raise ValueError(f"{path} is not one of the loaded dictionaries")
+        return bits
+
+    def sources_of(self, word: str) -> list:
+        """Labels of the dictionaries containing 'word' (empty if none do)."""
+        i = self.ids.get(word)
+        if i is None:
+            return []
+        bits = self.membership[i]
+        return [label for bit, label in enumerate(self.labels) if bits >> bit & 1]
+
+    def source_tag(self, word: str) -> str:
+        """Comma-separated labels of the dictionaries containing 'word'."""
+        return ", ".join(self.sources_of(word))
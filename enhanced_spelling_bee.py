@@ -1,47 +1,161 @@
+import contextlib
 import csv
+import heapq
+import os
 import re
-import nltk
+import threading
+from array import array
 from rich.console import Console
 from rich.table import Table
-from collections import Counter
+from compiled_dictionary import CompiledDictionary, is_compiled_dictionary
+from dictionary_cache import DictionaryCache, file_signature
+from dictionary_set import DictionarySet
+from letter_index import LetterIndex, letter_mask
+from ngram_model import load_or_build_model
+from result_cache import CandidateCache, ResultCache
+from solve_profile import null_phase
+from solve_result import SolveResult
 
 console = Console()
 
-#-------------------------Download and process corpus-------------------------
+#-------------------------Lazy n-gram frequency model-------------------------
 
-nltk.download('gutenberg')
-from nltk.corpus import gutenberg
+# Importing this module must stay side-effect free: the model (persisted by
+# ngram_model.py) is loaded on first use, or warmed in the background.
+_MODEL = None
+_MODEL_LOCK = threading.Lock()
 
-# Combine all words in Gutenberg corpus
-corpus = " ".join(gutenberg.words()).lower()
+def get_model():
+    """
+    Returns the n-gram frequency model, loading it on first call.
+    Safe to call from several threads; the model is only loaded once.
+    """
+    global _MODEL
+    if _MODEL is None:
+        with _MODEL_LOCK:
+            if _MODEL is None:
+                _MODEL = load_or_build_model()
+    return _MODEL
+
+def warm_model() -> threading.Thread:
+    """
+    Starts loading the n-gram model in a daemon thread so it is ready by the
+    time the first query runs. Returns the thread.
+    """
+    thread = threading.Thread(target=get_model, name="warm-ngram-model", daemon=True)
+    thread.start()
+    return thread
 
-# Remove non-alphabetic characters
-corpus = re.sub(r'[^a-z\s]', '', corpus)
+def __getattr__(name):
+    # Keeps 'enhanced_spelling_bee.bigram_freq' / 'trigram_freq' working without
+    # loading the model at import time.
+    if name == "bigram_freq":
+        return get_model().bigram_freq
+    if name == "trigram_freq":
+        return get_model().trigram_freq
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Bigram and trigram frequencies
-bigram_freq = Counter(corpus[i:i+2] for i in range(len(corpus) - 1))
-trigram_freq = Counter(corpus[i:i+3] for i in range(len(corpus) - 2))
+# ------------------------ DICTIONARY CACHE ------------------------
 
-# ------------------------ GLOBAL CACHE ------------------------
-_DICTIONARY_CACHE = None
+# Loaded dictionaries keyed by resolved path and (mtime, size), with LRU eviction.
+# Resize with DICTIONARY_CACHE.resize(max_bytes); inspect with dictionary_cache_stats().
+DICTIONARY_CACHE = DictionaryCache()
 
-def get_dictionary(dictionary_path: str):
+def load_dictionary(dictionary_path: str):
     """
-    Loads and caches the dictionary so we don't repeatedly read from disk.
-    Returns a list of lowercase words.
+    Returns the lowercase words of a dictionary file. Word-list files are read
+    into a list; compiled dictionaries (see compiled_dictionary.py) are
+    memory-mapped and return a lazily decoded sequence.
+    """
+    if is_compiled_dictionary(dictionary_path):
+        return CompiledDictionary(dictionary_path).words
+    with open(dictionary_path, 'r', encoding='utf-8') as f:
+        return [w.strip().lower() for w in f if w.strip()]
+
+def _load_index(dictionary_path) -> LetterIndex:
+    if isinstance(dictionary_path, tuple):
+        return DictionarySet([(path, load_dictionary(path)) for path in dictionary_path])
+    if is_compiled_dictionary(dictionary_path):
+        return CompiledDictionary(dictionary_path)
+    return LetterIndex(load_dictionary(dictionary_path))
+
+def get_index(dictionary_path) -> LetterIndex:
+    """
+    Returns the letter-mask index for a dictionary, loading it on first use and
+    again whenever the file changes on disk. Returns an empty index on failure.
+    A tuple of paths loads them together as one deduplicated DictionarySet,
+    so every solve function also accepts a tuple of dictionaries.
     """
-    global _DICTIONARY_CACHE
-    if _DICTIONARY_CACHE is not None:
-        return _DICTIONARY_CACHE
-    
     try:
-        with open(dictionary_path, 'r', encoding='utf-8') as f:
-            words = [w.strip().lower() for w in f if w.strip()]
-        _DICTIONARY_CACHE = words
-        return words
+        return DICTIONARY_CACHE.get(dictionary_path, _load_index, lambda index: index.nbytes())
     except Exception as e:
         console.print(f"[red]Failed to load dictionary: {e}[/red]")
-        return []
+        return LetterIndex([])
+
+def get_dictionary(dictionary_path: str):
+    """
+    Loads and caches the dictionary so we don't repeatedly read from disk.
+    Returns a sequence of lowercase words.
+    """
+    return get_index(dictionary_path).words
+
+def source_tagger(dictionary_path):
+    """
+    For a tuple of dictionaries, returns a function mapping a result word to
+    the labels of the dictionaries it appears in (for print_results and
+    export_to_csv); returns None for a single dictionary.
+    """
+    index = get_index(dictionary_path)
+    return index.source_tag if isinstance(index, DictionarySet) else None
+
+def dictionary_cache_stats() -> dict:
+    """Returns hit/miss/eviction counters and contents of the dictionary cache."""
+    return DICTIONARY_CACHE.stats()
+
+# ------------------------ RESULT CACHE ------------------------
+
+# Solved queries, keyed canonically. Set SPELLING_BEE_RESULT_CACHE to a file
+# path to also keep results on disk across restarts.
+RESULT_CACHE = ResultCache(disk_path=os.environ.get("SPELLING_BEE_RESULT_CACHE"))
+
+def query_key(dictionary_path, center, other_letters, min_length, max_length, must_contain, limit,
+              prefix="", suffix="", pattern="", scoring="ngram", require=(), exclude=()):
+    """
+    Returns the canonical cache key for a query, or None if the dictionary
+    cannot be stat'ed. Letter order and repeats don't matter; the dictionary
+    (or each dictionary of a set) is identified by resolved path, mtime and
+    size, and n-gram scores by the model's digest (NYT points don't depend
+    on the model).
+    """
+    try:
+        resolved, signature = file_signature(dictionary_path)
+    except OSError:
+        return None
+    center = center.lower()
+    letters = "".join(sorted(set(center + other_letters.lower())))
+    scorer = get_model().digest if scoring == "ngram" else scoring
+    return (resolved, signature, scorer,
+            center, letters, min_length, max_length, must_contain.lower(), limit,
+            prefix.lower(), suffix.lower(), pattern.lower(),
+            tuple(sorted(os.path.realpath(p) for p in require)),
+            tuple(sorted(os.path.realpath(p) for p in exclude)))
+
+def result_cache_stats() -> dict:
+    """Returns hit/miss counters of the query result cache."""
+    return RESULT_CACHE.stats()
+
+# Scored candidates of the last full solve, filtered again when the next query
+# only tightens the length or substring filters (see CandidateCache).
+CANDIDATE_CACHE = CandidateCache()
+
+def _refinement_key(key: tuple):
+    # Splits a query_key into (base, filters): the filters are min/max length,
+    # must_contain, prefix, suffix and pattern; the limit is applied afterwards.
+    return key[:5] + key[12:], (key[5], key[6], key[7], key[9], key[10], key[11])
+
+def candidate_cache_stats() -> dict:
+    """Returns refinement/miss counters of the candidate cache."""
+    return CANDIDATE_CACHE.stats()
 
 # ------------------------ SPELLING BEE LOGIC ------------------------
 
@@ -73,19 +187,110 @@ def trigram_score(word, trigram_freq):
     """
     return sum(trigram_freq.get(word[i:i+3], 0) for i in range(len(word) - 2))
 
-def combined_score(word, bigram_freq, trigram_freq, weight=0.5):
+def combined_score(word, bigram_freq=None, trigram_freq=None, weight=0.5):
     """
     Combine bigram and trigram scores with a weighted average and normalize by word length.
+    Frequencies default to the shared n-gram model, which is loaded on first use.
     """
+    if bigram_freq is None:
+        bigram_freq = get_model().bigram_freq
+    if trigram_freq is None:
+        trigram_freq = get_model().trigram_freq
     score_b = bigram_score(word, bigram_freq)
     score_t = trigram_score(word, trigram_freq)
     combined = score_b * weight + score_t * (1 - weight)
     return combined / len(word)  # Normalize by word length
 
+def score_words(words, model=None, weight=0.5) -> list:
+    """
+    Scores many words at once; equivalent to calling combined_score on each.
+    Uses the vectorized NumPy engine (batch_scoring.py) when NumPy is installed,
+    so scoring a whole dictionary is a single call.
+    """
+    if model is None:
+        model = get_model()
+    try:
+        from batch_scoring import score_words_numpy
+    except ImportError:
+        bigram_freq, trigram_freq = model.bigram_freq, model.trigram_freq
+        return [combined_score(w, bigram_freq, trigram_freq, weight) for w in words]
+    return score_words_numpy(words, model, weight).tolist()
+
+def get_word_scores(index: LetterIndex):
+    """
+    Returns the combined_score of every word in the index, in dictionary order.
+    Scores only depend on the word and the model, so they are computed once per
+    dictionary and model and kept on the index (compiled dictionaries may
+    already carry them).
+    """
+    model = get_model()
+    if index.scores is None or index.score_tag != model.digest:
+        index.scores = array("d", score_words(index.words, model))
+        index.score_tag = model.digest
+        _account(index)
+    return index.scores
+
+def _account(index: LetterIndex):
+    # Structures attached to a cached dictionary count towards the cache's cap.
+    DICTIONARY_CACHE.update_size(index, index.nbytes())
+
+# ------------------------ NYT SCORING ------------------------
+
+# "ngram" ranks words by how common their letter sequences are (scores are
+# normalized to 0-100); "nyt" scores them by the official rules in points.
+SCORING_MODES = ("ngram", "nyt")
+
+def _check_scoring(scoring: str):
+    if scoring not in SCORING_MODES:
+        raise ValueError(f"unknown scoring mode {scoring!r}; expected one of {', '.join(SCORING_MODES)}")
+
+def get_mask_aggregates(index: LetterIndex):
+    """
+    Returns the per-letter-mask word counts and points of a dictionary
+    (puzzle_space.MaskAggregates), building them on first use and keeping them
+    with the cached dictionary.
+    """
+    if index.mask_aggregates is None:
+        from puzzle_space import MaskAggregates
+        index.mask_aggregates = MaskAggregates(index)
+        _account(index)
+    return index.mask_aggregates
+
+def puzzle_ranks(dictionary_path: str, center: str, other_letters: str):
+    """
+    Returns the NYT totals of a puzzle without listing its words:
+    {"words", "pangrams", "max_points", "ranks": [(name, points needed), ...]},
+    from Beginner up to Genius (70%) and Queen Bee (100%). Uses at most 2**6
+    lookups in the dictionary's per-mask aggregates, so it is cheap enough to
+    rate thousands of puzzles. Returns None unless the puzzle has exactly 7
+    distinct letters a-z including the center.
+    """
+    from puzzle_space import PUZZLE_SIZE, rank_thresholds
+    center = center.lower()
+    letters_mask = letter_mask(center + other_letters.lower())
+    if len(center) != 1 or letters_mask < 0 or letters_mask.bit_count() != PUZZLE_SIZE:
+        return None
+    aggregates = get_mask_aggregates(get_index(dictionary_path))
+    words, max_points, pangrams = aggregates.puzzle_totals(letters_mask, letter_mask(center))
+    return {
+        "words": words,
+        "pangrams": pangrams,
+        "max_points": max_points,
+        "ranks": rank_thresholds(max_points),
+    }
+
+def _result_order(ws):
+    # Descending score, then descending length, then alphabetical.
+    return (-ws[1], -len(ws[0]), ws[0])
+
 def normalize_scores(valid_words):
     """
-    Normalize scores to a scale of 0 to 100.
+    Normalize scores to a scale of 0 to 100. A SolveResult is rescaled in
+    place and returned; a list of pairs is copied.
     """
+    if isinstance(valid_words, SolveResult):
+        valid_words.normalize()
+        return valid_words
     if not valid_words:
         return valid_words
 
@@ -95,6 +300,56 @@ def normalize_scores(valid_words):
 
     return [(word, (score / max_score) * 100) for word, score in valid_words]
 
+class ResultStats:
+    """
+    Accumulates summary statistics in a single pass over result rows, so a
+    result stream never has to be materialized or walked twice.
+    """
+
+    def __init__(self):
+        self.total_words = 0
+        self.pangrams_count = 0
+        self.total_length = 0
+        self.total_points = 0
+
+    def add(self, word: str, score: float, pangram: bool):
+        self.total_words += 1
+        self.pangrams_count += pangram
+        self.total_length += len(word)
+        self.total_points += score
+
+    def add_result(self, result: SolveResult):
+        """Adds a whole SolveResult from its arrays, without walking its rows."""
+        self.total_words += len(result)
+        self.pangrams_count += result.pangram_count()
+        self.total_length += sum(result.lengths)
+        self.total_points += result.total_score()
+
+    @property
+    def avg_length(self) -> float:
+        return self.total_length / self.total_words if self.total_words else 0
+
+    def as_dict(self) -> dict:
+        return {
+            "total_words": self.total_words,
+            "pangrams_count": self.pangrams_count,
+            "avg_length": self.avg_length,
+            "total_points": self.total_points,
+        }
+
+def iter_result_rows(valid_words, letters_set):
+    """
+    Yields (word, score, pangram) for each (word, score) result, computing the
+    pangram flag exactly once per word. Accepts any iterable, including the
+    generator from iter_spelling_bee_words; a SolveResult supplies the flags
+    it recorded during the solve.
+    """
+    if isinstance(valid_words, SolveResult):
+        yield from valid_words.iter_rows()
+        return
+    for word, score in valid_words:
+        yield word, score, is_pangram(word, letters_set)
+
 def gather_statistics(valid_words, letters_set):
     """
     Gathers additional stats:
@@ -103,17 +358,13 @@ def gather_statistics(valid_words, letters_set):
       - Average word length
       - Sum of scores
     """
-    total_words = len(valid_words)
-    pangrams_count = sum(is_pangram(w, letters_set) for w, s in valid_words)
-    avg_length = sum(len(w) for w, s in valid_words) / total_words if total_words else 0
-    total_points = sum(s for w, s in valid_words)
-
-    return {
-        "total_words": total_words,
-        "pangrams_count": pangrams_count,
-        "avg_length": avg_length,
-        "total_points": total_points,
-    }
+    stats = ResultStats()
+    if isinstance(valid_words, SolveResult):
+        stats.add_result(valid_words)
+        return stats.as_dict()
+    for row in iter_result_rows(valid_words, letters_set):
+        stats.add(*row)
+    return stats.as_dict()
 
 def find_valid_words(letters, center_letter, dictionary, bigram_freq, trigram_freq):
     """
@@ -129,6 +380,134 @@ def find_valid_words(letters, center_letter, dictionary, bigram_freq, trigram_fr
     ]
     return sorted(scored_candidates, key=lambda x: x[1], reverse=True)
 
+def compile_pattern(pattern: str):
+    """
+    Compiles a word pattern into a regex matching whole words:
+    '?' matches exactly one letter, '*' any run of letters (possibly empty),
+    everything else matches itself. Example: '?a??ing'.
+    """
+    parts = []
+    for char in pattern.lower():
+        if char == "?":
+            parts.append(".")
+        elif char == "*":
+            parts.append(".*")
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts))
+
+def _word_filter(min_length, max_length, must_contain, prefix, suffix, matcher):
+    """Returns a predicate applying the length, substring and pattern filters to a word."""
+    def keep(word):
+        return (len(word) >= min_length
+                and (max_length == 0 or len(word) <= max_length)
+                and (not must_contain or must_contain in word)
+                and word.startswith(prefix)
+                and word.endswith(suffix)
+                and (matcher is None or matcher.fullmatch(word)))
+    return keep
+
+def _rank_candidates(dictionary_path, center, other_letters, min_length, max_length, must_contain, limit,
+                     prefix="", suffix="", pattern="", profile=None, scoring="ngram", require=(), exclude=(),
+                     key=None):
+    """
+    Returns the raw-scored results for a query as a SolveResult, best first,
+    and the puzzle's letter set. Shared by the list and generator entry points.
+    With a SolveProfile, each phase (load, filter, score, sort) is timed.
+
+    Given the query's key, a query that only narrows the filters of the last
+    full solve is answered by filtering its stored candidates (a "refine"
+    phase replaces filter and score).
+    """
+    _check_scoring(scoring)
+    phase = profile.phase if profile is not None else null_phase
+    center = center.lower()
+    other_letters = other_letters.lower()
+    must_contain = must_contain.lower()
+    prefix, suffix, pattern = prefix.lower(), suffix.lower(), pattern.lower()
+    letters_set = set(center + other_letters)
+
+    base = filters = candidates = None
+    if key is not None:
+        base, filters = _refinement_key(key)
+        candidates = CANDIDATE_CACHE.get(base, filters)
+
+    with phase("load") as stats:
+        index = get_index(dictionary_path)
+        stats.count = len(index)
+    words = index.words
+
+    # A valid word is a pangram exactly when its letter mask is the puzzle's.
+    puzzle_mask = letter_mask(center + other_letters)
+    masks = index.masks
+
+    def pangrams(ids):
+        if puzzle_mask > 0:
+            return [masks[i] == puzzle_mask for i in ids]
+        return [is_pangram(words[i], letters_set) for i in ids]
+
+    if candidates is not None:
+        with phase("refine") as stats:
+            matcher = compile_pattern(pattern) if pattern else None
+            keep = _word_filter(min_length, max_length, must_contain, prefix, suffix, matcher)
+            candidate_ids, candidate_points = candidates
+            kept = [k for k, i in enumerate(candidate_ids) if keep(words[i])]
+            matches = [candidate_ids[k] for k in kept]
+            points = [candidate_points[k] for k in kept]
+            stats.count = len(matches)
+    else:
+        with phase("filter") as stats:
+            indices = index.candidate_indices(center, other_letters)
+            if indices is None:
+                # Letters the mask index can't express (non a-z) mean a scan.
+                indices = [i for i, word in enumerate(words) if is_valid_word(word, center, letters_set)]
+            matcher = compile_pattern(pattern) if pattern else None
+
+            # Set algebra over a DictionarySet: keep words found in every 'require'
+            # dictionary and in none of the 'exclude' ones.
+            if (require or exclude) and indices:
+                if not isinstance(index, DictionarySet):
+                    raise ValueError("require/exclude need several dictionaries loaded together")
+                all_of, none_of = index.source_bits(require), index.source_bits(exclude)
+                membership = index.membership
+                indices = [i for i in indices if membership[i] & all_of == all_of and not membership[i] & none_of]
+
+            keep = _word_filter(min_length, max_length, must_contain, prefix, suffix, matcher)
+            matches = [i for i in indices if keep(words[i])]
+            stats.count = len(matches)
+
+        with phase("score") as stats:
+            if scoring == "nyt":
+                from puzzle_space import PANGRAM_BONUS, word_points
+                points = [word_points(len(words[i])) + (PANGRAM_BONUS if pangram else 0)
+                          for i, pangram in zip(matches, pangrams(matches))]
+            else:
+                scores = get_word_scores(index)
+                points = [scores[i] for i in matches]
+            stats.count = len(points)
+
+    with phase("sort") as stats:
+        # (-score, -length, word, id) tuples sort like _result_order without
+        # calling a key function per comparison.
+        ranked = [(-p, -len(words[i]), words[i], i) for p, i in zip(points, matches)]
+        if 0 < limit < len(ranked):
+            ranked = heapq.nsmallest(limit, ranked)
+        else:
+            ranked.sort()
+        ids = array("I", [r[3] for r in ranked])
+        result = SolveResult.build(words, ids, (-r[0] for r in ranked), [-r[1] for r in ranked], pangrams(ids),
+                                   integer_scores=scoring == "nyt")
+        stats.count = len(result)
+
+    if base is not None and candidates is None:
+        # Raw scores are kept in full precision. Without a limit they are
+        # stored in order, so a refined query's sort has little to do.
+        if len(ranked) < len(matches):
+            CANDIDATE_CACHE.put(base, filters, (array("I", matches), array("d", points)))
+        else:
+            CANDIDATE_CACHE.put(base, filters, (ids, array("d", (-r[0] for r in ranked))))
+    return result, letters_set
+
 def find_spelling_bee_words(
     dictionary_path: str,
     center: str,
@@ -136,77 +515,273 @@ def find_spelling_bee_words(
     min_length: int = 4,
     max_length: int = 0,
     must_contain: str = "",
+    limit: int = 0,
+    prefix: str = "",
+    suffix: str = "",
+    pattern: str = "",
+    profile=None,
+    scoring: str = "ngram",
+    require=(),
+    exclude=(),
 ):
     """
     1. Loads (and caches) the dictionary from disk.
-    2. Filters valid words based on Spelling Bee constraints.
+    2. Filters valid words based on Spelling Bee constraints, using the
+       letter-mask index instead of scanning every word.
     3. Applies additional filters:
        - min_length
        - max_length (0 = no max)
        - must_contain (partial substring)
-    4. Calculates each word's score and returns the list of (word, score).
-    """
-    center = center.lower()
-    other_letters = other_letters.lower()
-    letters_set = set(center + other_letters)
-    word_list = get_dictionary(dictionary_path)
+       - prefix / suffix
+       - pattern ('?' = one letter, '*' = any run, e.g. '?a??ing')
+       These are checked word by word on the letter-mask candidates, which
+       are at most a few thousand words.
+    4. Looks up each word's precomputed score and returns the (word, score)
+       results, best first, as a SolveResult: parallel arrays of word ids,
+       float32 scores, lengths and pangram bits that iterate and index like
+       the list of pairs. With limit > 0 only the best 'limit' words are
+       selected (heap selection, no full sort).
+    Repeated queries are answered from RESULT_CACHE, and a query that only
+    tightens the filters of the previous one (higher min_length, lower
+    max_length, longer must_contain, ...) from its candidates (CANDIDATE_CACHE).
 
-    valid_words = [
-        (word, combined_score(word, bigram_freq, trigram_freq))
-        for word in word_list
-        if is_valid_word(word, center, letters_set)
-        and len(word) >= min_length
-        and (max_length == 0 or len(word) <= max_length)
-        and (not must_contain or must_contain.lower() in word)
-    ]
+    scoring selects how words are scored (see SCORING_MODES): "ngram" scores
+    are normalized to 0-100, "nyt" scores are NYT points (use puzzle_ranks
+    for the puzzle's maximum and rank thresholds).
+
+    dictionary_path may be a tuple of paths, solved as one deduplicated
+    DictionarySet; then 'require' and 'exclude' (paths from the tuple) keep
+    only words in all of the former and none of the latter, e.g.
+    require=(a,), exclude=(b,) for "in A but not B". Use source_tagger() to
+    label each result with its dictionaries.
+
+    Pass a solve_profile.SolveProfile as 'profile' to record per-phase timings
+    (and, if it asks for them, peak memory and cProfile output).
+    """
+    phase = profile.phase if profile is not None else null_phase
+    _check_scoring(scoring)
+    key = query_key(dictionary_path, center, other_letters, min_length, max_length, must_contain, limit,
+                    prefix, suffix, pattern, scoring, require, exclude)
+    # A cProfile run is for looking at the solve itself, so skip cached answers.
+    use_cache = key is not None and (profile is None or not profile.cprofile_path)
+    if use_cache:
+        with phase("cache") as stats:
+            cached = RESULT_CACHE.get(key)
+            stats.count = len(cached[0]) if cached is not None else 0
+        if cached is not None:
+            if profile is not None:
+                profile.cache_hit = True
+            return cached
 
-    valid_words.sort(key=lambda ws: (-ws[1], -len(ws[0]), ws[0]))
-    valid_words = normalize_scores(valid_words)
+    with profile.cprofile() if profile is not None else contextlib.nullcontext():
+        valid_words, letters_set = _rank_candidates(
+            dictionary_path, center, other_letters, min_length, max_length, must_contain, limit,
+            prefix, suffix, pattern, profile, scoring, require, exclude, key if use_cache else None)
+        # The best word is always kept, so normalizing the top 'limit' words gives
+        # the same values as normalizing the full list.
+        if scoring == "ngram":
+            with phase("normalize") as stats:
+                valid_words.normalize()
+                stats.count = len(valid_words)
 
+    if key is not None:
+        RESULT_CACHE.put(key, valid_words, letters_set)
     return valid_words, letters_set
 
-def print_results(valid_words, letters_set, dictionary_path, min_length, max_length, must_contain, center):
+def iter_spelling_bee_words(
+    dictionary_path: str,
+    center: str,
+    other_letters: str,
+    min_length: int = 4,
+    max_length: int = 0,
+    must_contain: str = "",
+    limit: int = 0,
+    prefix: str = "",
+    suffix: str = "",
+    pattern: str = "",
+    scoring: str = "ngram",
+    require=(),
+    exclude=(),
+):
     """
-    Prints results in a rich-formatted table and summary statistics.
+    Generator version of find_spelling_bee_words: yields the same normalized
+    (word, score) pairs, best first, one tuple at a time.
+    The letter set is set(center + other_letters).
     """
-    stats = gather_statistics(valid_words, letters_set)
+    ranked, _ = _rank_candidates(
+        dictionary_path, center, other_letters, min_length, max_length, must_contain, limit,
+        prefix, suffix, pattern, scoring=scoring, require=require, exclude=exclude)
+    if scoring == "ngram":
+        ranked.normalize()
+    yield from ranked
+
+def _format_score(score) -> str:
+    # NYT points are whole numbers; n-gram scores get two decimals.
+    return str(score) if isinstance(score, int) else f"{score:.2f}"
 
+def _results_table(rows, sources=None) -> Table:
     table = Table(title="Spelling Bee Results")
     table.add_column("Word", justify="left", style="cyan", no_wrap=True)
     table.add_column("Score", justify="right", style="magenta")
     table.add_column("Pangram?", justify="center", style="green")
+    if sources is not None:
+        table.add_column("Sources", justify="left", style="yellow")
+    for (w, s, pangram) in rows:
+        cells = [w, _format_score(s), "Yes" if pangram else ""]
+        if sources is not None:
+            cells.append(sources(w))
+        table.add_row(*cells)
+    return table
 
-    for (w, s) in valid_words:
-        pangram_flag = "Yes" if is_pangram(w, letters_set) else ""
-        table.add_row(w, f"{s:.2f}", pangram_flag)
-
+def _print_query(letters_set, dictionary_path, min_length, max_length, must_contain, center,
+                 prefix="", suffix="", pattern=""):
     console.print("============================================", style="bold yellow")
+    if isinstance(dictionary_path, tuple):
+        dictionary_path = ", ".join(dictionary_path)
     console.print(f"Dictionary       : {dictionary_path}", style="bold white")
     console.print(f"Letters Used     : {', '.join(sorted(letters_set))} (Center = '{center}')", style="bold white")
     console.print(f"Min length       : {min_length}", style="bold white")
     console.print(f"Max length       : {max_length if max_length else 'No limit'}", style="bold white")
     console.print(f"Must contain     : '{must_contain}'" if must_contain else "Must contain     : None", style="bold white")
+    if prefix:
+        console.print(f"Starts with      : '{prefix}'", style="bold white")
+    if suffix:
+        console.print(f"Ends with        : '{suffix}'", style="bold white")
+    if pattern:
+        console.print(f"Pattern          : '{pattern}'", style="bold white")
     console.print("============================================", style="bold yellow")
-    console.print(f"Total words      : {stats['total_words']}", style="bold white")
-    console.print(f"Number pangrams  : {stats['pangrams_count']}", style="bold white")
-    console.print(f"Average length   : {stats['avg_length']:.2f}", style="bold white")
-    console.print(f"Sum of all scores: {stats['total_points']}", style="bold white")
+
+def _print_stats(stats: ResultStats, ranks=None):
+    console.print(f"Total words      : {stats.total_words}", style="bold white")
+    console.print(f"Number pangrams  : {stats.pangrams_count}", style="bold white")
+    console.print(f"Average length   : {stats.avg_length:.2f}", style="bold white")
+    console.print(f"Sum of all scores: {stats.total_points}", style="bold white")
+    if ranks is not None:
+        thresholds = dict(ranks["ranks"])
+        console.print(f"Puzzle max points: {ranks['max_points']} ({ranks['words']} words, {ranks['pangrams']} pangrams)",
+                      style="bold white")
+        console.print(f"Genius           : {thresholds['Genius']} points", style="bold white")
+        console.print(f"Queen Bee        : {thresholds['Queen Bee']} points", style="bold white")
     console.print("============================================", style="bold yellow")
 
+def print_results(valid_words, letters_set, dictionary_path, min_length, max_length, must_contain, center,
+                  max_rows: int = 0, page_size: int = 0, prefix: str = "", suffix: str = "", pattern: str = "",
+                  profile=None, scoring: str = "ngram", sources=None, ranks=None):
+    """
+    Prints results in a rich-formatted table and summary statistics.
+
+    valid_words may be a list or a generator; it is consumed once. With
+    max_rows > 0 only the first rows are rendered (stats still cover every
+    result). With page_size > 0 the table is printed a page at a time, asking
+    before each next page, and the summary statistics follow the table.
+    With a SolveProfile, rendering is timed as the 'render' phase (paged
+    output includes the time spent waiting at the prompt).
+    With scoring="nyt" the summary adds the puzzle's maximum points and the
+    Genius and Queen Bee thresholds, taken from 'ranks' when the caller
+    already has them (e.g. from a solve server) and otherwise looked up with
+    puzzle_ranks. 'sources' (see source_tagger) adds a column naming the
+    dictionaries each word comes from.
+    """
+    if scoring != "nyt":
+        ranks = None
+    elif ranks is None:
+        ranks = puzzle_ranks(dictionary_path, center, "".join(sorted(letters_set - {center})))
+    with profile.phase("render") if profile is not None else null_phase("render") as phase_stats:
+        stats = _render_results(valid_words, letters_set, dictionary_path, min_length, max_length, must_contain,
+                                center, max_rows, page_size, prefix, suffix, pattern, ranks, sources)
+        phase_stats.count = stats.total_words
+
+def _render_results(valid_words, letters_set, dictionary_path, min_length, max_length, must_contain, center,
+                    max_rows, page_size, prefix, suffix, pattern, ranks, sources) -> ResultStats:
+    stats = ResultStats()
+    rows = iter_result_rows(valid_words, letters_set)
+    # A SolveResult's totals come from its arrays, so rows are only walked
+    # as far as they are shown.
+    counted = isinstance(valid_words, SolveResult)
+    if counted:
+        stats.add_result(valid_words)
+
+    if page_size > 0:
+        _print_query(letters_set, dictionary_path, min_length, max_length, must_contain, center,
+                     prefix, suffix, pattern)
+        page = []
+        show = True
+        for row in rows:
+            if not counted:
+                stats.add(*row)
+            if not show:
+                if counted:
+                    break
+                continue
+            page.append(row)
+            if len(page) == page_size:
+                console.print(_results_table(page, sources))
+                page = []
+                answer = console.input("[bold]Enter[/bold] for more, 'q' to skip to the summary: ")
+                show = not answer.strip().lower().startswith("q")
+        if page:
+            console.print(_results_table(page, sources))
+        _print_stats(stats, ranks)
+        return stats
+
+    shown = []
+    for row in rows:
+        if not counted:
+            stats.add(*row)
+        if not max_rows or len(shown) < max_rows:
+            shown.append(row)
+        elif counted:
+            break
+
+    _print_query(letters_set, dictionary_path, min_length, max_length, must_contain, center,
+                     prefix, suffix, pattern)
+    _print_stats(stats, ranks)
+    console.print(_results_table(shown, sources))
+    if len(shown) < stats.total_words:
+        console.print(f"... {stats.total_words - len(shown)} more words not shown (export to CSV to see all).", style="bold yellow")
+    return stats
+
+def print_profile(profile):
+    """Prints a SolveProfile as a per-phase table."""
+    table = Table(title="Solve Profile")
+    table.add_column("Phase", justify="left", style="cyan", no_wrap=True)
+    table.add_column("Wall (ms)", justify="right", style="magenta")
+    table.add_column("Items", justify="right", style="green")
+    table.add_column("Peak memory", justify="right", style="yellow")
+    for stats in profile.phases.values():
+        table.add_row(
+            stats.name,
+            f"{stats.wall_ms:.3f}",
+            "" if stats.count is None else str(stats.count),
+            "" if stats.peak_bytes is None else f"{stats.peak_bytes / 1024:.1f} KiB",
+        )
     console.print(table)
+    console.print(f"Total            : {profile.total_ms:.3f} ms" + (" (result cache hit)" if profile.cache_hit else ""),
+                  style="bold white")
+    if profile.cprofile_path:
+        console.print(f"cProfile stats   : {profile.cprofile_path} (view with python -m pstats)", style="bold white")
 
-def export_to_csv(valid_words, letters_set, csv_path: str):
+def export_to_csv(valid_words, letters_set, csv_path: str, sources=None):
     """
     Writes the results to a CSV file, including pangram info.
+    Rows are streamed, so valid_words may be a generator of any size.
+    With 'sources' (see source_tagger) a sources column is added.
     """
     try:
         with open(csv_path, mode="w", newline="", encoding="utf-8") as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow(["word", "score", "pangram"])
-            for (w, s) in valid_words:
-                pangram_flag = "Yes" if is_pangram(w, letters_set) else "No"
-                writer.writerow([w, f"{s:.2f}", pangram_flag])
+            if sources is None:
+                writer.writerow(["word", "score", "pangram"])
+                writer.writerows(
+                    (w, _format_score(s), "Yes" if pangram else "No")
+                    for w, s, pangram in iter_result_rows(valid_words, letters_set)
+                )
+            else:
+                writer.writerow(["word", "score", "pangram", "sources"])
+                writer.writerows(
+                    (w, _format_score(s), "Yes" if pangram else "No", sources(w))
+                    for w, s, pangram in iter_result_rows(valid_words, letters_set)
+                )
         console.print(f"\n[green]Results successfully written to {csv_path}![/green]")
     except Exception as e:
         console.print(f"[red]Failed to write CSV file: {e}[/red]")
-
@@ -1,57 +1,162 @@
 try:
     import tkinter as tk
-    from tkinter import messagebox
+    from tkinter import messagebox, ttk
 except ImportError as e:
     print("tkinter is not installed or configured correctly. Please ensure it is installed.")
     raise e
 
-from enhanced_spelling_bee import get_dictionary, find_spelling_bee_words, print_results, export_to_csv
+import queue
+import threading
 
-def on_check_words():
+from dictionary_set import parse_dictionary_paths
+from enhanced_spelling_bee import get_dictionary, find_spelling_bee_words, print_results, export_to_csv, warm_model
+from enhanced_spelling_bee import source_tagger
+from solve_profile import SolveProfile
+
+# Lines inserted into result_text per event-loop turn, and how often the
+# main thread checks for finished solves (ms).
+RESULT_CHUNK_LINES = 500
+POLL_INTERVAL_MS = 50
+# First check for a live-filter solve: narrowing the filters of the last solve
+# only re-filters its candidates, which takes well under a millisecond.
+LIVE_POLL_MS = 1
+
+# Solves run on worker threads and hand results back through this queue; only
+# the Tk main thread touches widgets. Each solve gets a generation number, and
+# results (or rendering) from an older generation are dropped as stale.
+solve_results = queue.Queue()
+solve_generation = 0
+last_result = None  # (query, valid_words, letters_set) of the last finished solve
+
+def read_query(quiet=False):
+    """
+    Reads the form into a query tuple: (dictionary_path, center, other_letters,
+    min_length, max_length, must_contain, prefix, suffix, pattern).
+    Several comma-separated dictionary paths are solved together.
+    Shows an error (unless quiet) and returns None if the input is invalid.
+    """
     center = entry_center.get().strip().lower()
     other_letters = entry_other_letters.get().strip().lower()
-    min_length = int(entry_min_length.get().strip() or 4)
-    max_length = int(entry_max_length.get().strip() or 0)
     must_contain = entry_must_contain.get().strip().lower()
-    dictionary_path = entry_dictionary_path.get().strip() or "words.txt"
+    prefix = entry_prefix.get().strip().lower()
+    suffix = entry_suffix.get().strip().lower()
+    pattern = entry_pattern.get().strip().lower()
+    dictionary_path = parse_dictionary_paths(entry_dictionary_path.get().strip() or "words.txt")
+    try:
+        min_length = int(entry_min_length.get().strip() or 4)
+        max_length = int(entry_max_length.get().strip() or 0)
+    except ValueError:
+        if not quiet:
+            messagebox.showerror("Input Error", "Word lengths must be whole numbers.")
+        return None
 
     if len(center) != 1 or len(other_letters) != 6:
-        messagebox.showerror("Input Error", "Please provide exactly one center letter and six other letters.")
-        return
+        if not quiet:
+            messagebox.showerror("Input Error", "Please provide exactly one center letter and six other letters.")
+        return None
+
+    return (dictionary_path, center, other_letters, min_length, max_length, must_contain, prefix, suffix, pattern)
+
+def solve_worker(generation, query):
+    dictionary_path, center, other_letters, min_length, max_length, must_contain, prefix, suffix, pattern = query
+    profile = SolveProfile()
+    try:
+        valid_words, letters_set = find_spelling_bee_words(
+            dictionary_path=dictionary_path,
+            center=center,
+            other_letters=other_letters,
+            min_length=min_length,
+            max_length=max_length,
+            must_contain=must_contain,
+            prefix=prefix,
+            suffix=suffix,
+            pattern=pattern,
+            profile=profile,
+        )
+        solve_results.put((generation, query, valid_words, letters_set, profile, None))
+    except Exception as e:
+        solve_results.put((generation, query, None, None, profile, e))
 
-    valid_words, letters_set = find_spelling_bee_words(
-        dictionary_path=dictionary_path,
-        center=center,
-        other_letters=other_letters,
-        min_length=min_length,
-        max_length=max_length,
-        must_contain=must_contain,
-    )
+def start_solve(query, on_done, first_poll_ms=POLL_INTERVAL_MS):
+    """
+    Solves 'query' on a worker thread and calls on_done(valid_words, letters_set)
+    on the main thread, unless a newer solve has been started in the meantime.
+    """
+    global solve_generation
+    solve_generation += 1
+    generation = solve_generation
+    status_var.set("Solving...")
+    progress.start(10)
+    threading.Thread(target=solve_worker, args=(generation, query), daemon=True).start()
 
+    def poll():
+        global last_result
+        if generation != solve_generation:
+            return  # superseded; the newer solve's poll takes over
+        try:
+            result_generation, result_query, valid_words, letters_set, profile, error = solve_results.get_nowait()
+        except queue.Empty:
+            root.after(POLL_INTERVAL_MS, poll)
+            return
+        if result_generation != generation:
+            # Result of a stale query that finished late: drop it and keep waiting.
+            root.after(0, poll)
+            return
+        progress.stop()
+        profile_var.set(f"Last solve: {profile.total_ms:.1f} ms ({profile.summary_line()})")
+        if error is not None:
+            status_var.set("")
+            messagebox.showerror("Solve Error", str(error))
+            return
+        last_result = (result_query, valid_words, letters_set)
+        on_done(valid_words, letters_set)
+
+    root.after(first_poll_ms, poll)
+
+def show_results(valid_words, letters_set):
+    """Inserts results into result_text in chunks so large result sets don't freeze the window."""
+    generation = solve_generation
     result_text.delete(1.0, tk.END)
-    for word, score in valid_words:
-        result_text.insert(tk.END, f"{word} (Score: {score:.2f})\n")
+    sources = source_tagger(last_result[0][0])
+    if sources is None:
+        lines = [f"{word} (Score: {score:.2f})\n" for word, score in valid_words]
+    else:
+        lines = [f"{word} (Score: {score:.2f}) [{sources(word)}]\n" for word, score in valid_words]
+
+    def insert_chunk(start):
+        if generation != solve_generation:
+            return  # a newer query replaced these results
+        result_text.insert(tk.END, "".join(lines[start:start + RESULT_CHUNK_LINES]))
+        end = start + RESULT_CHUNK_LINES
+        if end < len(lines):
+            status_var.set(f"Showing {end} of {len(lines)} words...")
+            root.after(1, insert_chunk, end)
+        else:
+            status_var.set(f"{len(lines)} words")
+
+    insert_chunk(0)
+
+def on_check_words():
+    query = read_query()
+    if query is not None:
+        start_solve(query, show_results)
 
 def on_export_csv():
     csv_path = entry_csv_path.get().strip() or "results.csv"
-    center = entry_center.get().strip().lower()
-    other_letters = entry_other_letters.get().strip().lower()
-    min_length = int(entry_min_length.get().strip() or 4)
-    max_length = int(entry_max_length.get().strip() or 0)
-    must_contain = entry_must_contain.get().strip().lower()
-    dictionary_path = entry_dictionary_path.get().strip() or "words.txt"
+    query = read_query()
+    if query is None:
+        return
 
-    valid_words, letters_set = find_spelling_bee_words(
-        dictionary_path=dictionary_path,
-        center=center,
-        other_letters=other_letters,
-        min_length=min_length,
-        max_length=max_length,
-        must_contain=must_contain,
-    )
+    def export(valid_words, letters_set):
+        export_to_csv(valid_words, letters_set, csv_path, sources=source_tagger(query[0]))
+        status_var.set(f"Exported {len(valid_words)} words")
+        messagebox.showinfo("Export Success", f"Results successfully written to {csv_path}!")
 
-    export_to_csv(valid_words, letters_set, csv_path)
-    messagebox.showinfo("Export Success", f"Results successfully written to {csv_path}!")
+    # Reuse the last result set when the inputs haven't changed.
+    if last_result is not None and last_result[0] == query:
+        export(last_result[1], last_result[2])
+    else:
+        start_solve(query, export)
 
 def on_focus_in(event):
     if event.widget.get() in default_values.values():
@@ -68,6 +173,19 @@ def on_key_release(event):
     if event.widget.get() not in default_values.values():
         event.widget.config(fg="black")
 
+def on_filter_key_release(event):
+    """
+    Live filtering: once the letters have been solved, each edit of a length,
+    substring or pattern filter re-runs the query. The engine answers a
+    tightened filter from the previous solve's candidates, without a rescan.
+    """
+    if last_result is None:
+        return
+    query = read_query(quiet=True)
+    if query is None or query == last_result[0] or query[:3] != last_result[0][:3]:
+        return
+    start_solve(query, show_results, first_poll_ms=LIVE_POLL_MS)
+
 # Create the main application window
 root = tk.Tk()
 root.title("Spelling Bee Solver")
@@ -122,27 +240,53 @@ tk.Label(frame, text="Must Contain Substring:", bg="#FFD700", fg="black").grid(r
 entry_must_contain = tk.Entry(frame, width=50, bg="lightgrey", fg="black")
 entry_must_contain.grid(row=6, column=1, padx=10, pady=5)
 
+tk.Label(frame, text="Starts With:", bg="#FFD700", fg="black").grid(row=7, column=0, sticky=tk.W, padx=10, pady=5)
+entry_prefix = tk.Entry(frame, width=50, bg="lightgrey", fg="black")
+entry_prefix.grid(row=7, column=1, padx=10, pady=5)
+
+tk.Label(frame, text="Ends With:", bg="#FFD700", fg="black").grid(row=8, column=0, sticky=tk.W, padx=10, pady=5)
+entry_suffix = tk.Entry(frame, width=50, bg="lightgrey", fg="black")
+entry_suffix.grid(row=8, column=1, padx=10, pady=5)
+
+tk.Label(frame, text="Pattern (? = letter, * = any):", bg="#FFD700", fg="black").grid(row=9, column=0, sticky=tk.W, padx=10, pady=5)
+entry_pattern = tk.Entry(frame, width=50, bg="lightgrey", fg="black")
+entry_pattern.grid(row=9, column=1, padx=10, pady=5)
+
 button_check = tk.Button(frame,highlightbackground="#FFD700", text="Check Words", command=on_check_words, bg="white", fg="black")
-button_check.grid(row=7, column=0, columnspan=2, padx=10, pady=10)
+button_check.grid(row=10, column=0, columnspan=2, padx=10, pady=10)
 
-tk.Label(frame, text="Results:", bg="#FFD700", fg="black").grid(row=8, column=0, sticky=tk.W, padx=10, pady=5)
+tk.Label(frame, text="Results:", bg="#FFD700", fg="black").grid(row=11, column=0, sticky=tk.W, padx=10, pady=5)
+status_var = tk.StringVar(value="")
+tk.Label(frame, textvariable=status_var, bg="#FFD700", fg="black").grid(row=11, column=1, sticky=tk.W, padx=10, pady=5)
+progress = ttk.Progressbar(frame, mode="indeterminate", length=150)
+progress.grid(row=11, column=1, sticky=tk.E, padx=10, pady=5)
 result_text = tk.Text(frame, height=10, width=65, bg="lightgrey", fg="black")
-result_text.grid(row=9, column=1, columnspan=2, pady=5)
+result_text.grid(row=12, column=1, columnspan=2, pady=5)
 
-tk.Label(frame, text="File Export Path:", bg="#FFD700", fg="black").grid(row=10, column=0, sticky=tk.W, padx=10, pady=5)
+tk.Label(frame, text="File Export Path:", bg="#FFD700", fg="black").grid(row=13, column=0, sticky=tk.W, padx=10, pady=5)
 entry_csv_path = tk.Entry(frame, width=50, bg="lightgrey", fg="darkgrey")
 default_values[entry_csv_path] = "./"
 entry_csv_path.insert(0, "./output.csv")
-entry_csv_path.grid(row=10, column=1, padx=10, pady=5)
+entry_csv_path.grid(row=13, column=1, padx=10, pady=5)
 
 button_export = tk.Button(frame, highlightbackground="#FFD700", text="Export to File", command=on_export_csv, bg="white", fg="black")
-button_export.grid(row=11, column=0, columnspan=2, pady=10)
+button_export.grid(row=14, column=0, columnspan=2, pady=10)
+
+# Per-phase timings of the last solve
+profile_var = tk.StringVar(value="")
+tk.Label(frame, textvariable=profile_var, bg="#FFD700", fg="black", font=("Helvetica", 10)).grid(
+    row=15, column=0, columnspan=2, sticky=tk.W, padx=10, pady=5)
 
 # Bind focus in, focus out, and key release events
 for entry in default_values.keys():
     entry.bind("<FocusIn>", on_focus_in)
     entry.bind("<FocusOut>", on_focus_out)
     entry.bind("<KeyRelease>", on_key_release)
+for entry in (entry_min_length, entry_max_length, entry_must_contain, entry_prefix, entry_suffix, entry_pattern):
+    entry.bind("<KeyRelease>", on_filter_key_release, add="+")
+
+# Load the scoring model in the background while the user fills in the form
+warm_model()
 
 # Start the GUI event loop
 root.mainloop()
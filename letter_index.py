@@ -0,0 +1,119 @@
+import string
+import sys
+
+# ------------------------ LETTER MASKS ------------------------
+
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(string.ascii_lowercase)}
+
+def letter_mask(word: str) -> int:
+    """
+    Returns the 26-bit mask of the letters used in 'word' (bit 0 = 'a').
+    Returns -1 if the word contains anything outside a-z, so it can never
+    match a puzzle mask.
+    """
+    mask = 0
+    for char in word:
+        bit = LETTER_BITS.get(char)
+        if bit is None:
+            return -1
+        mask |= bit
+    return mask
+
+def subset_masks(mask: int):
+    """
+    Yields every subset of 'mask' (including 0 and 'mask' itself).
+    """
+    subset = mask
+    while True:
+        yield subset
+        if subset == 0:
+            return
+        subset = (subset - 1) & mask
+
+# ------------------------ INDEX ------------------------
+
+def derived_nbytes(index) -> int:
+    """Memory of the mask aggregates built on an index, in bytes."""
+    if index.mask_aggregates is not None:
+        return index.mask_aggregates.nbytes()
+    return 0
+
+class LetterIndex:
+    """
+    Groups the words of a dictionary by their letter mask so a puzzle can be
+    answered with at most 2**6 bucket lookups instead of a full scan.
+
+    Buckets hold word positions, so results come back in dictionary order,
+    exactly as a linear scan would produce them.
+    """
+
+    def __init__(self, words):
+        self.words = words
+        # Words with characters outside a-z get mask 0, which no puzzle can match.
+        self.masks = [max(letter_mask(w), 0) for w in words]
+        self.lengths = [len(w) for w in words]
+        self.buckets = {}
+        for i, mask in enumerate(self.masks):
+            if mask:
+                self.buckets.setdefault(mask, []).append(i)
+        # Per-word scores, filled in by the scoring engine; score_tag names the
+        # model they were computed with.
+        self.scores = None
+        self.score_tag = ""
+        # Per-letter-mask word counts and points (puzzle_space.MaskAggregates),
+        # built on demand for NYT rank thresholds.
+        self.mask_aggregates = None
+
+    def __len__(self):
+        return len(self.words)
+
+    def nbytes(self) -> int:
+        """
+        Rough estimate of the memory held by the words and the index, in bytes,
+        including the scores and mask aggregates attached so far.
+        """
+        size = sys.getsizeof(self.words) + sum(sys.getsizeof(w) for w in self.words)
+        size += sys.getsizeof(self.masks) + sys.getsizeof(self.lengths)
+        size += sys.getsizeof(self.buckets) + sum(sys.getsizeof(b) for b in self.buckets.values())
+        # Small ints are shared, but the masks are not.
+        size += 32 * len(self.masks)
+        if self.scores is not None:
+            size += sys.getsizeof(self.scores)
+        return size + derived_nbytes(self)
+
+    def bucket(self, mask: int):
+        """Returns the positions of all words whose letter mask is exactly 'mask'."""
+        return self.buckets.get(mask, ())
+
+    def candidate_indices(self, center: str, other_letters: str) -> list:
+        """
+        Returns the sorted positions of all words that pass is_valid_word:
+        at least 4 letters, containing the center, using only puzzle letters.
+        Returns None if the letters cannot be expressed as a mask (non a-z input
+        or a multi-character center), in which case the caller should scan.
+        """
+        if len(center) != 1:
+            return None
+        center_mask = letter_mask(center)
+        outer_mask = letter_mask(other_letters)
+        if center_mask <= 0 or outer_mask < 0:
+            return None
+        outer_mask &= ~center_mask
+
+        lengths = self.lengths
+        indices = []
+        for subset in subset_masks(outer_mask):
+            indices.extend(i for i in self.bucket(subset | center_mask) if lengths[i] >= 4)
+        indices.sort()
+        return indices
+
+    def candidates(self, center: str, other_letters: str) -> list:
+        """
+        Returns the valid words for the puzzle in dictionary order, or None
+        if the index cannot answer the query (see candidate_indices).
+        """
+        indices = self.candidate_indices(center, other_letters)
+        if indices is None:
+            return None
+        words = self.words
+        return [words[i] for i in indices]
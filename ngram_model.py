@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+
+import argparse
+import hashlib
+import itertools
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from rich.console import Console
+
+from process_pool import pool_context
+
+console = Console()
+
+# ------------------------ FILE FORMAT ------------------------
+#
+# header : magic (4 bytes), format version (uint16), alphabet size (uint16)
+# body   : 26*26 bigram counts, then 26**3 trigram counts, as little-endian uint64
+#
+# Index of an n-gram is its letters read as a base-26 number ('ab' -> 0*26 + 1).
+
+MODEL_MAGIC = b"SBNG"
+MODEL_VERSION = 1
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+ALPHABET_SIZE = len(ALPHABET)
+BIGRAM_SIZE = ALPHABET_SIZE ** 2
+TRIGRAM_SIZE = ALPHABET_SIZE ** 3
+
+_HEADER = struct.Struct("<4sHH")
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ngram_model.bin")
+
+class NgramModel:
+    """
+    Dense bigram/trigram letter counts.
+
+    bigram_freq and trigram_freq expose the same {ngram: count} mappings the
+    scoring functions have always used; they are built from the arrays on first
+    access and only contain n-grams that actually occurred.
+    """
+
+    def __init__(self, bigram_counts: array, trigram_counts: array):
+        if len(bigram_counts) != BIGRAM_SIZE or len(trigram_counts) != TRIGRAM_SIZE:
+            raise ValueError("n-gram count arrays have the wrong size")
+        self.bigram_counts = bigram_counts
+        self.trigram_counts = trigram_counts
+        self._bigram_freq = None
+        self._trigram_freq = None
+        self._digest = None
+
+    @property
+    def digest(self) -> str:
+        """
+        Short content hash of the counts. Anything derived from the model (such as
+        precomputed word scores) records this to know when it is stale.
+        """
+        if self._digest is None:
+            h = hashlib.blake2b(digest_size=8)
+            h.update(self.bigram_counts.tobytes())
+            h.update(self.trigram_counts.tobytes())
+            self._digest = h.hexdigest()
+        return self._digest
+
+    @property
+    def bigram_freq(self) -> dict:
+        if self._bigram_freq is None:
+            self._bigram_freq = _counts_to_dict(self.bigram_counts, 2)
+        return self._bigram_freq
+
+    @property
+    def trigram_freq(self) -> dict:
+        if self._trigram_freq is None:
+            self._trigram_freq = _counts_to_dict(self.trigram_counts, 3)
+        return self._trigram_freq
+
+def _ngram_name(index: int, n: int) -> str:
+    letters = []
+    for _ in range(n):
+        index, code = divmod(index, ALPHABET_SIZE)
+        letters.append(ALPHABET[code])
+    return "".join(reversed(letters))
+
+def _counts_to_dict(counts: array, n: int) -> dict:
+    return {_ngram_name(i, n): count for i, count in enumerate(counts) if count}
+
+def _empty_counts(size: int) -> array:
+    return array("Q", bytes(8 * size))
+
+# ------------------------ BUILDING ------------------------
+
+def clean_corpus(text: str) -> str:
+    """
+    Lowercases the text and removes everything except a-z and whitespace,
+    exactly as the original in-memory pipeline did.
+    """
+    return re.sub(r'[^a-z\s]', '', text.lower())
+
+def count_ngrams(cleaned: str, bigram_counts: array, trigram_counts: array):
+    """
+    Adds the letter bigrams and trigrams of an already cleaned corpus to the
+    count arrays. N-grams spanning whitespace are never letters-only, so each
+    distinct token is counted once and weighted by how often it occurs.
+    """
+    for token, occurrences in Counter(cleaned.split()).items():
+        codes = [ord(c) - 97 for c in token]
+        for i in range(len(codes) - 1):
+            bigram_counts[codes[i] * ALPHABET_SIZE + codes[i + 1]] += occurrences
+        for i in range(len(codes) - 2):
+            trigram_counts[(codes[i] * ALPHABET_SIZE + codes[i + 1]) * ALPHABET_SIZE + codes[i + 2]] += occurrences
+
+def build_model_from_text(text: str) -> NgramModel:
+    """Builds a model from raw corpus text."""
+    bigram_counts = _empty_counts(BIGRAM_SIZE)
+    trigram_counts = _empty_counts(TRIGRAM_SIZE)
+    count_ngrams(clean_corpus(text), bigram_counts, trigram_counts)
+    return NgramModel(bigram_counts, trigram_counts)
+
+# ------------------------ SHARDED BUILDING ------------------------
+#
+# A corpus is split into shards (Gutenberg files, or line-aligned byte ranges
+# of local text files). Each shard is streamed in chunks that end on a token
+# boundary and counted into its own arrays, in a process pool; the per-shard
+# counts are then summed. Tokens never span chunks, shards or files, so the
+# result is identical to cleaning and counting the whole joined corpus at once.
+
+DEFAULT_SHARD_BYTES = 8 * 1024 * 1024
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+DEFAULT_CHUNK_WORDS = 200_000
+
+def _iter_range_chunks(path: str, start: int, end: int, chunk_bytes: int):
+    """
+    Yields the decoded text of every line of 'path' that starts in the byte
+    range [start, end), joined into chunks of about chunk_bytes.
+    """
+    with open(path, 'rb') as f:
+        if start:
+            # Skip the rest of a line that began before 'start'; its shard owns it.
+            f.seek(start - 1)
+            f.readline()
+        position = f.tell()
+        lines = []
+        size = 0
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            lines.append(line)
+            size += len(line)
+            if size >= chunk_bytes:
+                yield b"".join(lines).decode('utf-8', errors='ignore')
+                lines = []
+                size = 0
+        if lines:
+            yield b"".join(lines).decode('utf-8', errors='ignore')
+
+def _iter_gutenberg_chunks(fileid: str, chunk_words: int):
+    """Yields the words of one Gutenberg file, space-joined, chunk_words at a time."""
+    from nltk.corpus import gutenberg
+
+    words = iter(gutenberg.words(fileid))
+    while True:
+        chunk = list(itertools.islice(words, chunk_words))
+        if not chunk:
+            return
+        yield " ".join(chunk)
+
+def count_shard(shard: tuple):
+    """
+    Counts one shard and returns its (bigram_counts, trigram_counts):
+    ("file", path, start, end, chunk_bytes) or ("gutenberg", fileid, chunk_words).
+    """
+    if shard[0] == "file":
+        chunks = _iter_range_chunks(*shard[1:])
+    else:
+        chunks = _iter_gutenberg_chunks(*shard[1:])
+    bigram_counts = _empty_counts(BIGRAM_SIZE)
+    trigram_counts = _empty_counts(TRIGRAM_SIZE)
+    for chunk in chunks:
+        count_ngrams(clean_corpus(chunk), bigram_counts, trigram_counts)
+    return bigram_counts, trigram_counts
+
+def _add_counts(total: array, part: array):
+    for i, count in enumerate(part):
+        if count:
+            total[i] += count
+
+def build_model_from_shards(shards, workers: int = None) -> NgramModel:
+    """
+    Counts the shards in a pool of 'workers' processes (default: CPU count;
+    1 counts in this process) and merges the per-shard counts into a model.
+    """
+    shards = list(shards)
+    workers = min(workers or os.cpu_count() or 1, max(1, len(shards)))
+    bigram_counts = _empty_counts(BIGRAM_SIZE)
+    trigram_counts = _empty_counts(TRIGRAM_SIZE)
+
+    def merge(results):
+        for bigrams, trigrams in results:
+            _add_counts(bigram_counts, bigrams)
+            _add_counts(trigram_counts, trigrams)
+
+    if workers == 1:
+        merge(map(count_shard, shards))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as executor:
+            merge(executor.map(count_shard, shards))
+    return NgramModel(bigram_counts, trigram_counts)
+
+def file_shards(paths, shard_bytes: int = DEFAULT_SHARD_BYTES, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> list:
+    """Splits text files into byte-range shards of about shard_bytes each."""
+    shards = []
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), shard_bytes):
+            shards.append(("file", path, start, min(start + shard_bytes, size), chunk_bytes))
+    return shards
+
+def build_model_from_gutenberg(workers: int = None) -> NgramModel:
+    """
+    Builds the model from the NLTK Gutenberg corpus, downloading it if needed,
+    one shard per file. This is the only place that touches NLTK.
+    """
+    import nltk
+    nltk.download('gutenberg', quiet=True)
+    from nltk.corpus import gutenberg
+
+    shards = [("gutenberg", fileid, DEFAULT_CHUNK_WORDS) for fileid in gutenberg.fileids()]
+    return build_model_from_shards(shards, workers)
+
+def build_model_from_directory(corpus_dir: str, workers: int = None) -> NgramModel:
+    """Builds the model from every .txt file in a local directory."""
+    paths = [os.path.join(corpus_dir, name) for name in sorted(os.listdir(corpus_dir)) if name.endswith(".txt")]
+    return build_model_from_shards(file_shards(paths), workers)
+
+# ------------------------ PERSISTENCE ------------------------
+
+def save_model(model: NgramModel, model_path: str = DEFAULT_MODEL_PATH):
+    """Writes the model to disk atomically."""
+    tmp_path = model_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MODEL_MAGIC, MODEL_VERSION, ALPHABET_SIZE))
+        for counts in (model.bigram_counts, model.trigram_counts):
+            if sys.byteorder == "big":
+                counts = array("Q", counts)
+                counts.byteswap()
+            counts.tofile(f)
+    os.replace(tmp_path, model_path)
+
+def load_model(model_path: str = DEFAULT_MODEL_PATH) -> NgramModel:
+    """
+    Loads a model written by save_model.
+    Raises ValueError if the file is not a model of the current format version.
+    """
+    with open(model_path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError(f"{model_path} is not an n-gram model file")
+        magic, version, alphabet_size = _HEADER.unpack(header)
+        if magic != MODEL_MAGIC or alphabet_size != ALPHABET_SIZE:
+            raise ValueError(f"{model_path} is not an n-gram model file")
+        if version != MODEL_VERSION:
+            raise ValueError(f"{model_path} has model version {version}, expected {MODEL_VERSION}")
+
+        bigram_counts = array("Q")
+        trigram_counts = array("Q")
+        try:
+            bigram_counts.fromfile(f, BIGRAM_SIZE)
+            trigram_counts.fromfile(f, TRIGRAM_SIZE)
+        except EOFError:
+            raise ValueError(f"{model_path} is truncated")
+
+    if sys.byteorder == "big":
+        bigram_counts.byteswap()
+        trigram_counts.byteswap()
+    return NgramModel(bigram_counts, trigram_counts)
+
+def load_or_build_model(model_path: str = DEFAULT_MODEL_PATH) -> NgramModel:
+    """
+    Loads the persisted model, building it from the Gutenberg corpus (and saving
+    it for next time) only if the file is missing or out of date.
+
+    This is the implicit first-run build behind get_model(), which runs on
+    background threads (and next to Tk in the GUI), so it counts in this
+    process instead of forking a pool; 'python ngram_model.py build' is the
+    parallel path.
+    """
+    try:
+        return load_model(model_path)
+    except FileNotFoundError:
+        pass
+    except ValueError as e:
+        console.print(f"[yellow]{e}; rebuilding n-gram model.[/yellow]")
+
+    model = build_model_from_gutenberg(workers=1)
+    try:
+        save_model(model, model_path)
+    except OSError as e:
+        console.print(f"[red]Failed to save n-gram model: {e}[/red]")
+    return model
+
+# ------------------------ COMMAND LINE ------------------------
+
+def parse_args():
+    """
+    Parse command-line arguments for the n-gram model builder.
+    Example usage:
+        python ngram_model.py build
+        python ngram_model.py build --corpus-dir texts/ --output ngram_model.bin --workers 8
+    """
+    parser = argparse.ArgumentParser(
+        description="Build or inspect the persisted bigram/trigram frequency model."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="(Re)build the model from a corpus.")
+    build.add_argument(
+        "--corpus-dir",
+        default=None,
+        help="Directory of .txt files to use instead of the NLTK Gutenberg corpus."
+    )
+    build.add_argument(
+        "-o", "--output",
+        default=DEFAULT_MODEL_PATH,
+        help="Path of the model file to write (default: ngram_model.bin next to this script)."
+    )
+    build.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes counting shards in parallel (default: CPU count)."
+    )
+
+    info = subparsers.add_parser("info", help="Print a summary of an existing model.")
+    info.add_argument(
+        "-m", "--model",
+        default=DEFAULT_MODEL_PATH,
+        help="Path of the model file to read."
+    )
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.command == "build":
+        start = time.perf_counter()
+        if args.corpus_dir:
+            model = build_model_from_directory(args.corpus_dir, args.workers)
+        else:
+            model = build_model_from_gutenberg(args.workers)
+        save_model(model, args.output)
+        console.print(f"[green]Model written to {args.output} in {time.perf_counter() - start:.1f}s.[/green]")
+    else:
+        model = load_model(args.model)
+        console.print(f"Model file       : {args.model}", style="bold white")
+        console.print(f"Format version   : {MODEL_VERSION}", style="bold white")
+        console.print(f"Digest           : {model.digest}", style="bold white")
+        console.print(f"Distinct bigrams : {len(model.bigram_freq)}", style="bold white")
+        console.print(f"Distinct trigrams: {len(model.trigram_freq)}", style="bold white")
+        console.print(f"Total bigrams    : {sum(model.bigram_counts)}", style="bold white")
+        console.print(f"Total trigrams   : {sum(model.trigram_counts)}", style="bold white")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+import multiprocessing
+
+def pool_context():
+    """
+    Multiprocessing context for worker pools. Prefers fork, so workers share the
+    parent's loaded data copy-on-write and start without re-importing anything;
+    falls back to the platform default where fork is unavailable.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
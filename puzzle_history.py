@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import threading
+import time
+from array import array
+from collections import Counter
+from datetime import datetime
+
+from rich.console import Console
+from rich.table import Table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from letter_index import letter_mask
+from puzzle_space import PANGRAM_BONUS, mask_letters, word_points
+
+console = Console()
+
+# ------------------------ STORE LAYOUT ------------------------
+#
+# A history is a directory of append-only files:
+#   FORMAT           format version
+#   vocabulary.txt   one word per line; a word's id is its line number
+#   word_ids.I       uint32 word ids of every puzzle, back to back
+#   <column>.<code>  one little-endian array per puzzle column (see COLUMNS)
+#
+# Puzzles are numbered in append order. Each append writes the vocabulary and
+# word ids first and the puzzle columns last, so a crash leaves at most a
+# partial row, which is trimmed on the next open. A torn last value in a
+# column file and a vocabulary line without its newline are dropped too.
+
+HISTORY_VERSION = "1"
+
+COLUMNS = (
+    ("solved_at", "q"),   # unix time in seconds
+    ("letters", "I"),     # letter mask of the puzzle's 7 letters
+    ("center", "B"),      # bit index of the center letter
+    ("word_start", "Q"),  # offset of the puzzle's words in word_ids
+    ("word_count", "I"),
+    ("points", "I"),      # NYT points of all words
+    ("pangrams", "H"),
+)
+
+def _column_path(directory: str, name: str, typecode: str) -> str:
+    return os.path.join(directory, f"{name}.{typecode}")
+
+def _read_column(path: str, typecode: str) -> array:
+    values = array(typecode)
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        data = b""
+    # A crash mid-append can leave a torn last value; cut the file back to
+    # whole values before the row-level trim.
+    whole = len(data) - len(data) % values.itemsize
+    if whole != len(data):
+        os.truncate(path, whole)
+        data = data[:whole]
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def _append_column(path: str, values: array):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    with open(path, 'ab') as f:
+        values.tofile(f)
+
+def _truncate_column(path: str, values: array, rows: int):
+    del values[rows:]
+    if os.path.exists(path):
+        os.truncate(path, rows * values.itemsize)
+
+# ------------------------ HISTORY ------------------------
+
+class PuzzleHistory:
+    """
+    Append-only, columnar store of solved puzzles.
+
+    Every column is loaded into a compact array on open; word ids point into
+    the history's own vocabulary, so each distinct word is stored once however
+    many puzzles it appears in, and ids stay valid if a dictionary changes.
+    The word index (word id -> puzzle numbers) and letter-set index are built
+    from the columns on the first query after an open or append, with a single
+    NumPy sort when NumPy is installed.
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._lock = threading.Lock()
+
+        format_path = os.path.join(directory, "FORMAT")
+        if os.path.exists(format_path):
+            with open(format_path, 'r', encoding='ascii') as f:
+                version = f.read().strip()
+            if version != HISTORY_VERSION:
+                raise ValueError(f"{directory} has history format {version}, expected {HISTORY_VERSION}")
+        else:
+            with open(format_path, 'w', encoding='ascii') as f:
+                f.write(HISTORY_VERSION + "\n")
+
+        self.vocabulary = self._read_vocabulary()
+        self.word_ids_of = {word: i for i, word in enumerate(self.vocabulary)}
+        self.word_ids = _read_column(_column_path(directory, "word_ids", "I"), "I")
+        self.columns = {name: _read_column(_column_path(directory, name, code), code) for name, code in COLUMNS}
+        self._trim()
+
+        self._word_index = None
+        self._letters_index = None
+
+    def _vocabulary_path(self) -> str:
+        return os.path.join(self.directory, "vocabulary.txt")
+
+    def _read_vocabulary(self) -> list:
+        path = self._vocabulary_path()
+        with open(path, 'ab+') as f:
+            f.seek(0)
+            data = f.read()
+        # A last line without its newline was cut off mid-write. Its puzzle's
+        # word ids were never written, so dropping it loses nothing, and the
+        # next append starts on a fresh line.
+        whole = data.rfind(b"\n") + 1
+        if whole != len(data):
+            os.truncate(path, whole)
+        return data[:whole].decode('utf-8').splitlines()
+
+    def _trim(self):
+        """Drops a partially written last row (see the layout notes)."""
+        rows = min(len(values) for values in self.columns.values())
+        starts, counts = self.columns["word_start"], self.columns["word_count"]
+        while rows and starts[rows - 1] + counts[rows - 1] > len(self.word_ids):
+            rows -= 1
+        for name, code in COLUMNS:
+            if len(self.columns[name]) != rows:
+                _truncate_column(_column_path(self.directory, name, code), self.columns[name], rows)
+        used = starts[rows - 1] + counts[rows - 1] if rows else 0
+        if len(self.word_ids) != used:
+            _truncate_column(_column_path(self.directory, "word_ids", "I"), self.word_ids, used)
+
+    def __len__(self):
+        return len(self.columns["solved_at"])
+
+    # ------------------------ WRITING ------------------------
+
+    def append(self, center: str, other_letters: str, valid_words, solved_at: float = None) -> int:
+        """
+        Records one solved puzzle and returns its puzzle number. valid_words is
+        the (word, score) list of a full solve; points and pangrams are stored
+        by NYT rules, whatever scoring produced the list.
+        """
+        center = center.lower()
+        letters_mask = letter_mask(center + other_letters.lower())
+        center_mask = letter_mask(center)
+        if len(center) != 1 or center_mask <= 0 or letters_mask < 0:
+            raise ValueError("puzzle letters must be a-z with a single center letter")
+        solved_at = int(time.time() if solved_at is None else solved_at)
+
+        with self._lock:
+            ids = array("I")
+            new_words = []
+            points = pangrams = 0
+            seen = set()
+            for word, _ in valid_words:
+                if word in seen:
+                    continue  # duplicate lines in the dictionary
+                seen.add(word)
+                word_id = self.word_ids_of.get(word)
+                if word_id is None:
+                    word_id = self.word_ids_of[word] = len(self.vocabulary)
+                    self.vocabulary.append(word)
+                    new_words.append(word)
+                ids.append(word_id)
+                pangram = letter_mask(word) == letters_mask
+                pangrams += pangram
+                points += word_points(len(word)) + (PANGRAM_BONUS if pangram else 0)
+
+            number = len(self)
+            row = {
+                "solved_at": solved_at,
+                "letters": letters_mask,
+                "center": center_mask.bit_length() - 1,
+                "word_start": len(self.word_ids),
+                "word_count": len(ids),
+                "points": points,
+                "pangrams": pangrams,
+            }
+            if new_words:
+                with open(self._vocabulary_path(), 'a', encoding='utf-8') as f:
+                    f.write("".join(word + "\n" for word in new_words))
+            _append_column(_column_path(self.directory, "word_ids", "I"), ids)
+            self.word_ids.extend(ids)
+            for name, code in COLUMNS:
+                value = array(code, [row[name]])
+                _append_column(_column_path(self.directory, name, code), value)
+                self.columns[name].extend(value)
+
+            # Rebuilt on the next query; that takes milliseconds even for years of puzzles.
+            self._word_index = None
+            self._letters_index = None
+            return number
+
+    # ------------------------ INDEXES ------------------------
+
+    def _indexes(self):
+        """
+        Returns (offsets, postings, letters_index). The puzzles containing word
+        id w are postings[offsets[w]:offsets[w + 1]], ascending; letters_index
+        maps a letter mask to its puzzle numbers.
+        """
+        with self._lock:
+            if self._word_index is None:
+                self._word_index = self._build_word_index()
+                letters_index = {}
+                for number, mask in enumerate(self.columns["letters"]):
+                    letters_index.setdefault(mask, array("I")).append(number)
+                self._letters_index = letters_index
+            return self._word_index + (self._letters_index,)
+
+    def _build_word_index(self):
+        rows = len(self)
+        counts = self.columns["word_count"]
+        if np is not None:
+            # A stable sort by word id keeps each word's puzzles in ascending order.
+            puzzle_of = np.repeat(np.arange(rows, dtype=np.uint32), np.frombuffer(counts, dtype=np.uint32))
+            ids = np.frombuffer(self.word_ids, dtype=np.uint32)
+            order = np.argsort(ids, kind="stable")
+            offsets = np.searchsorted(ids[order], np.arange(len(self.vocabulary) + 1))
+            return offsets, puzzle_of[order]
+        # Counting sort: the same layout without NumPy.
+        offsets = array("Q", bytes(8 * (len(self.vocabulary) + 1)))
+        for word_id in self.word_ids:
+            offsets[word_id + 1] += 1
+        for i in range(len(self.vocabulary)):
+            offsets[i + 1] += offsets[i]
+        postings = array("I", bytes(4 * len(self.word_ids)))
+        fill = array("Q", offsets)
+        starts = self.columns["word_start"]
+        for number in range(rows):
+            for word_id in self.word_ids[starts[number]:starts[number] + counts[number]]:
+                postings[fill[word_id]] = number
+                fill[word_id] += 1
+        return offsets, postings
+
+    # ------------------------ QUERIES ------------------------
+
+    def puzzle(self, number: int) -> dict:
+        """Returns one recorded puzzle with its words."""
+        columns = self.columns
+        start, count = columns["word_start"][number], columns["word_count"][number]
+        center_bit = columns["center"][number]
+        return {
+            "number": number,
+            "solved_at": columns["solved_at"][number],
+            "letters": mask_letters(columns["letters"][number]),
+            "center": chr(ord("a") + center_bit),
+            "words": [self.vocabulary[i] for i in self.word_ids[start:start + count]],
+            "points": columns["points"][number],
+            "pangrams": columns["pangrams"][number],
+        }
+
+    def puzzles_with_word(self, word: str) -> list:
+        """Numbers of the puzzles whose solution contains 'word'."""
+        word_id = self.word_ids_of.get(word.lower())
+        if word_id is None:
+            return []
+        offsets, postings, _ = self._indexes()
+        return [int(n) for n in postings[offsets[word_id]:offsets[word_id + 1]]]
+
+    def puzzles_with_letters(self, letters: str, center: str = "") -> list:
+        """Numbers of the puzzles with exactly this letter set (and center, if given)."""
+        numbers = self._indexes()[2].get(letter_mask(letters.lower()), ())
+        if not center:
+            return list(numbers)
+        center_bit = letter_mask(center.lower()).bit_length() - 1
+        centers = self.columns["center"]
+        return [n for n in numbers if centers[n] == center_bit]
+
+    def top_words(self, count: int = 20) -> list:
+        """The 'count' words that appeared in the most puzzles, as (word, puzzles)."""
+        offsets, _, _ = self._indexes()
+        frequencies = Counter({word_id: int(offsets[word_id + 1] - offsets[word_id])
+                               for word_id in range(len(self.vocabulary))})
+        return [(self.vocabulary[word_id], n) for word_id, n in frequencies.most_common(count)]
+
+    def summary(self, since: float = None, until: float = None) -> dict:
+        """
+        Puzzle count and average words, points and pangrams of the puzzles
+        solved in [since, until) (unix times; None = unbounded).
+        """
+        columns = self.columns
+        rows = [
+            n for n, solved_at in enumerate(columns["solved_at"])
+            if (since is None or solved_at >= since) and (until is None or solved_at < until)
+        ]
+        total = len(rows)
+
+        def average(name):
+            values = columns[name]
+            return sum(values[n] for n in rows) / total if total else 0
+
+        return {
+            "puzzles": total,
+            "avg_words": average("word_count"),
+            "avg_points": average("points"),
+            "avg_pangrams": average("pangrams"),
+            "distinct_words": len(self.vocabulary),
+        }
+
+# ------------------------ COMMAND LINE ------------------------
+
+def _parse_date(text: str) -> float:
+    return datetime.strptime(text, "%Y-%m-%d").timestamp()
+
+def parse_args():
+    """
+    Parse command-line arguments for querying a puzzle history.
+    Example usage:
+        python puzzle_history.py history/ stats --since 2024-01-01
+        python puzzle_history.py history/ word caption
+        python puzzle_history.py history/ letters acinopt
+        python puzzle_history.py history/ top -n 25
+    """
+    parser = argparse.ArgumentParser(
+        description="Query the history of solved Spelling Bee puzzles (recorded with cli.py --history)."
+    )
+    parser.add_argument("history", help="History directory.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    stats = subparsers.add_parser("stats", help="Average puzzle size over a date range.")
+    stats.add_argument("--since", type=_parse_date, default=None, help="First day (YYYY-MM-DD).")
+    stats.add_argument("--until", type=_parse_date, default=None, help="Day after the last (YYYY-MM-DD).")
+
+    word = subparsers.add_parser("word", help="Puzzles a word has appeared in.")
+    word.add_argument("word")
+
+    letters = subparsers.add_parser("letters", help="Puzzles with a given letter set.")
+    letters.add_argument("letters")
+    letters.add_argument("--center", default="", help="Only puzzles with this center letter.")
+
+    top = subparsers.add_parser("top", help="Words that appeared in the most puzzles.")
+    top.add_argument("-n", "--count", type=int, default=20, help="Number of words (default: 20).")
+    return parser.parse_args()
+
+def _print_puzzles(history: PuzzleHistory, numbers):
+    table = Table(title="Puzzles")
+    table.add_column("#", justify="right", style="cyan")
+    table.add_column("Solved", justify="left", style="cyan")
+    table.add_column("Letters", justify="left", style="cyan")
+    table.add_column("Center", justify="center", style="cyan")
+    table.add_column("Words", justify="right", style="magenta")
+    table.add_column("Points", justify="right", style="magenta")
+    table.add_column("Pangrams", justify="right", style="green")
+    columns = history.columns
+    for n in numbers:
+        table.add_row(
+            str(n),
+            datetime.fromtimestamp(columns["solved_at"][n]).strftime("%Y-%m-%d %H:%M"),
+            mask_letters(columns["letters"][n]),
+            chr(ord("a") + columns["center"][n]),
+            str(columns["word_count"][n]),
+            str(columns["points"][n]),
+            str(columns["pangrams"][n]),
+        )
+    console.print(table)
+
+def main():
+    args = parse_args()
+    try:
+        history = PuzzleHistory(args.history)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Failed to open history: {e}[/red]")
+        return
+
+    start = time.perf_counter()
+    if args.command == "stats":
+        summary = history.summary(args.since, args.until)
+        elapsed = time.perf_counter() - start
+        console.print(f"Puzzles          : {summary['puzzles']}", style="bold white")
+        console.print(f"Average words    : {summary['avg_words']:.1f}", style="bold white")
+        console.print(f"Average points   : {summary['avg_points']:.1f}", style="bold white")
+        console.print(f"Average pangrams : {summary['avg_pangrams']:.2f}", style="bold white")
+        console.print(f"Distinct words   : {summary['distinct_words']}", style="bold white")
+    elif args.command == "word":
+        numbers = history.puzzles_with_word(args.word)
+        elapsed = time.perf_counter() - start
+        console.print(f"'{args.word}' appeared in {len(numbers)} of {len(history)} puzzles.", style="bold white")
+        _print_puzzles(history, numbers)
+    elif args.command == "letters":
+        numbers = history.puzzles_with_letters(args.letters, args.center)
+        elapsed = time.perf_counter() - start
+        _print_puzzles(history, numbers)
+    else:
+        words = history.top_words(args.count)
+        elapsed = time.perf_counter() - start
+        table = Table(title="Most frequent words")
+        table.add_column("Word", justify="left", style="cyan")
+        table.add_column("Puzzles", justify="right", style="magenta")
+        for word, count in words:
+            table.add_row(word, str(count))
+        console.print(table)
+    console.print(f"Query time       : {elapsed * 1000:.1f} ms", style="bold white")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import string
+import sys
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+console = Console()
+
+PANGRAM_BONUS = 7
+PUZZLE_SIZE = 7
+SORT_COLUMNS = ("words", "points", "pangrams")
+
+# NYT rank names and the share of the puzzle's maximum points each one needs.
+NYT_RANKS = (
+    ("Beginner", 0),
+    ("Good Start", 2),
+    ("Moving Up", 5),
+    ("Good", 8),
+    ("Solid", 15),
+    ("Nice", 25),
+    ("Great", 40),
+    ("Amazing", 50),
+    ("Genius", 70),
+    ("Queen Bee", 100),
+)
+GENIUS_PERCENT = 70
+
+def word_points(length: int) -> int:
+    """Points for a non-pangram word, as in spelling_bee_helper.compute_score."""
+    return max(1, length - 3)
+
+def rank_threshold(max_points: int, percent: int) -> int:
+    """Points needed for a rank worth 'percent' of max_points, rounded to the nearest point."""
+    return (max_points * percent + 50) // 100
+
+def rank_thresholds(max_points: int) -> list:
+    """Returns [(rank name, points needed)] for a puzzle worth max_points, lowest rank first."""
+    return [(name, rank_threshold(max_points, percent)) for name, percent in NYT_RANKS]
+
+# ------------------------ PER-MASK AGGREGATES ------------------------
+
+class MaskAggregates:
+    """
+    Statistics of a dictionary grouped by letter mask, over the words that can
+    appear in any puzzle (at least 4 letters, at most 7 distinct letters).
+
+    counts[mask] is the number of words, points[mask] their points without the
+    pangram bonus. A 7-letter mask's words are exactly the pangrams of that
+    letter set, so the bonus is added per puzzle.
+    """
+
+    def __init__(self, index):
+        self.counts = {}
+        self.points = {}
+        for mask, length in zip(index.masks, index.lengths):
+            if mask and length >= 4 and mask.bit_count() <= PUZZLE_SIZE:
+                self.counts[mask] = self.counts.get(mask, 0) + 1
+                self.points[mask] = self.points.get(mask, 0) + word_points(length)
+
+    def nbytes(self) -> int:
+        """Rough estimate of the memory held by the aggregates, in bytes."""
+        # Keys are shared by both dicts; each key and value is its own int.
+        return (sys.getsizeof(self.counts) + sys.getsizeof(self.points)
+                + 3 * 32 * len(self.counts))
+
+    def puzzle_masks(self) -> list:
+        """Every 7-letter set with at least one pangram, as sorted masks."""
+        return sorted(mask for mask in self.counts if mask.bit_count() == PUZZLE_SIZE)
+
+    def puzzle_totals(self, letters_mask: int, center_mask: int):
+        """
+        Returns (words, points, pangrams) for one puzzle by summing the
+        aggregates of every subset of its letters that contains the center,
+        with at most 2**6 lookups.
+        """
+        outer = letters_mask & ~center_mask
+        words = points = 0
+        subset = outer
+        while True:
+            mask = subset | center_mask
+            words += self.counts.get(mask, 0)
+            points += self.points.get(mask, 0)
+            if subset == 0:
+                break
+            subset = (subset - 1) & outer
+        pangrams = self.counts.get(letters_mask, 0) if letters_mask.bit_count() == PUZZLE_SIZE else 0
+        return words, points + PANGRAM_BONUS * pangrams, pangrams
+
+# ------------------------ WHOLE-SPACE ENUMERATION ------------------------
+
+def _subset_sum(values):
+    """
+    In-place zeta (subset-sum) transform along the last axis, which indexes the
+    2**7 subsets of a puzzle's letters: afterwards values[..., s] is the sum
+    over all subsets of s.
+    """
+    n = values.shape[0]
+    for bit in range(PUZZLE_SIZE):
+        view = values.reshape(n, 2 ** (PUZZLE_SIZE - 1 - bit), 2, 2 ** bit)
+        view[:, :, 1, :] += view[:, :, 0, :]
+
+def enumerate_puzzles(aggregates: MaskAggregates):
+    """
+    Computes word count, points and pangram count for every legal puzzle (each
+    7-letter set with a pangram, with each of its letters as center) in one pass.
+
+    For every letter set the per-mask aggregates of its 128 subsets are gathered
+    and subset-summed; the total for center c is then the full-set sum minus the
+    sum over subsets that lack c. Returns a dict of equal-length NumPy columns:
+    letters_mask, center (bit index), words, points, pangrams, genius (points
+    needed for the Genius rank).
+    """
+    if np is None:
+        raise ImportError("puzzle space enumeration requires NumPy")
+
+    keys = np.array(sorted(aggregates.counts), dtype=np.int64)
+    counts = np.array([aggregates.counts[k] for k in keys.tolist()], dtype=np.int64)
+    points = np.array([aggregates.points[k] for k in keys.tolist()], dtype=np.int64)
+    puzzles = keys[np.array([k.bit_count() == PUZZLE_SIZE for k in keys.tolist()], dtype=bool)]
+    n = len(puzzles)
+
+    # Bit positions of each puzzle's 7 letters, then the masks of all 128 subsets.
+    bits = (puzzles[:, None] >> np.arange(26)) & 1
+    positions = np.nonzero(bits)[1].reshape(n, PUZZLE_SIZE)
+    selector = (np.arange(2 ** PUZZLE_SIZE)[:, None] >> np.arange(PUZZLE_SIZE)) & 1
+    subsets = (np.int64(1) << positions) @ selector.T
+
+    slots = np.minimum(np.searchsorted(keys, subsets), len(keys) - 1)
+    present = keys[slots] == subsets
+    subset_words = np.where(present, counts[slots], 0)
+    subset_points = np.where(present, points[slots], 0)
+    _subset_sum(subset_words)
+    _subset_sum(subset_points)
+
+    full = 2 ** PUZZLE_SIZE - 1
+    without_center = full ^ (1 << np.arange(PUZZLE_SIZE))
+    pangrams = counts[np.searchsorted(keys, puzzles)]
+    words = subset_words[:, [full]] - subset_words[:, without_center]
+    total_points = subset_points[:, [full]] - subset_points[:, without_center] + PANGRAM_BONUS * pangrams[:, None]
+
+    return {
+        "letters_mask": np.repeat(puzzles, PUZZLE_SIZE),
+        "center": positions.ravel(),
+        "words": words.ravel(),
+        "points": total_points.ravel(),
+        "pangrams": np.repeat(pangrams, PUZZLE_SIZE),
+        "genius": rank_threshold(total_points.ravel(), GENIUS_PERCENT),
+    }
+
+def sort_puzzles(table: dict, column: str = "points", ascending: bool = False):
+    """Returns row order for the table, by 'column' then letters and center."""
+    primary = table[column] if ascending else -table[column]
+    return np.lexsort((table["center"], table["letters_mask"], primary))
+
+def mask_letters(mask: int) -> str:
+    return "".join(letter for i, letter in enumerate(string.ascii_lowercase) if mask >> i & 1)
+
+def iter_rows(table: dict, order):
+    """Yields (letters, center, words, points, pangrams, genius) rows in the given order."""
+    for i in order.tolist():
+        yield (
+            mask_letters(int(table["letters_mask"][i])),
+            string.ascii_lowercase[table["center"][i]],
+            int(table["words"][i]),
+            int(table["points"][i]),
+            int(table["pangrams"][i]),
+            int(table["genius"][i]),
+        )
+
+# ------------------------ COMMAND LINE ------------------------
+
+def parse_args():
+    """
+    Parse command-line arguments for the puzzle space analysis.
+    Example usage:
+        python puzzle_space.py -d words_enable.txt --sort points --top 25 --csv puzzles.csv
+    """
+    parser = argparse.ArgumentParser(
+        description="Rank every legal Spelling Bee puzzle (7-letter set with a pangram, any center)."
+    )
+    parser.add_argument(
+        "-d", "--dictionary",
+        default="words_enable.txt",
+        help="Path to dictionary file, text or compiled (default: words_enable.txt)."
+    )
+    parser.add_argument(
+        "--sort",
+        choices=SORT_COLUMNS,
+        default="points",
+        help="Column to rank by (default: points)."
+    )
+    parser.add_argument(
+        "--ascending",
+        action="store_true",
+        help="Sort smallest first instead of largest first."
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of puzzles to print (default: 20)."
+    )
+    parser.add_argument(
+        "--csv",
+        dest="csv_path",
+        default=None,
+        help="Optional path to write the full sorted table as CSV."
+    )
+    return parser.parse_args()
+
+def main():
+    from enhanced_spelling_bee import get_index
+
+    args = parse_args()
+    start = time.perf_counter()
+    aggregates = MaskAggregates(get_index(args.dictionary))
+    table = enumerate_puzzles(aggregates)
+    order = sort_puzzles(table, args.sort, args.ascending)
+    elapsed = time.perf_counter() - start
+
+    console.print(f"Dictionary       : {args.dictionary}", style="bold white")
+    console.print(f"Letter sets      : {len(order) // PUZZLE_SIZE}", style="bold white")
+    console.print(f"Puzzles          : {len(order)}", style="bold white")
+    console.print(f"Time             : {elapsed:.2f}s", style="bold white")
+
+    result_table = Table(title=f"Puzzles by {args.sort}")
+    result_table.add_column("Letters", justify="left", style="cyan", no_wrap=True)
+    result_table.add_column("Center", justify="center", style="cyan")
+    result_table.add_column("Words", justify="right", style="magenta")
+    result_table.add_column("Points", justify="right", style="magenta")
+    result_table.add_column("Pangrams", justify="right", style="green")
+    result_table.add_column("Genius", justify="right", style="yellow")
+    for n, row in enumerate(iter_rows(table, order)):
+        if n >= args.top:
+            break
+        result_table.add_row(*(str(value) for value in row))
+    console.print(result_table)
+
+    if args.csv_path:
+        try:
+            with open(args.csv_path, mode="w", newline="", encoding="utf-8") as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(["letters", "center", "words", "points", "pangrams", "genius"])
+                writer.writerows(iter_rows(table, order))
+            console.print(f"\n[green]Results successfully written to {args.csv_path}![/green]")
+        except Exception as e:
+            console.print(f"[red]Failed to write CSV file: {e}[/red]")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from solve_result import SolveResult
+
+DEFAULT_MAX_ENTRIES = 256
+
+def _copy_words(words):
+    return words.copy() if isinstance(words, SolveResult) else list(words)
+
+def _dump_value(value) -> str:
+    words, letters_set = value
+    rows = words.iter_rows() if isinstance(words, SolveResult) else (
+        (w, s, letters_set <= set(w)) for w, s in words)
+    stored = {"words": [], "scores": [], "pangrams": [], "letters": sorted(letters_set)}
+    for k, (word, score, pangram) in enumerate(rows):
+        stored["words"].append(word)
+        stored["scores"].append(score)
+        if pangram:
+            stored["pangrams"].append(k)
+    stored["integer_scores"] = bool(getattr(words, "integer_scores", False))
+    return json.dumps(stored)
+
+def _load_value(text: str):
+    """
+    Rebuilds a stored result as a SolveResult over its own word list. Entries
+    written before scores were stored separately hold [word, score] pairs; their
+    pangram flags are re-derived from the letters.
+    """
+    stored = json.loads(text)
+    letters_set = frozenset(stored["letters"])
+    words = stored["words"]
+    if "scores" in stored:
+        scores = stored["scores"]
+        pangrams = set(stored["pangrams"])
+        flags = (k in pangrams for k in range(len(words)))
+        integer_scores = stored["integer_scores"]
+    else:
+        words, scores = [w for w, s in words], [s for w, s in words]
+        flags = (letters_set <= set(w) for w in words)
+        integer_scores = all(isinstance(s, int) for s in scores)
+    result = SolveResult.build(words, range(len(words)), scores, [len(w) for w in words],
+                               flags, integer_scores=integer_scores)
+    return result, letters_set
+
+class ResultCache:
+    """
+    Query result cache: an in-memory LRU in front of an optional on-disk store.
+
+    Keys are canonical query tuples (see enhanced_spelling_bee.query_key) that
+    already include the dictionary's (path, mtime, size) and the model digest,
+    so a changed dictionary or model simply never matches old entries.
+    The disk store is a small SQLite file, opened on first use, so results
+    survive process restarts. It keeps each result's words, scores and pangram
+    positions, and a disk hit is rebuilt as a SolveResult.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, disk_path: str = None):
+        self.max_entries = max_entries
+        self.disk_path = disk_path
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        if self._db is None:
+            directory = os.path.dirname(os.path.abspath(self.disk_path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.disk_path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        return self._db
+
+    def get(self, key: tuple):
+        """
+        Returns (valid_words, letters_set) for 'key', or None on a miss.
+        The returned results are a copy, so callers may modify them.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return _copy_words(value[0]), set(value[1])
+
+            if self.disk_path:
+                row = self._connect().execute(
+                    "SELECT value FROM results WHERE key = ?", (json.dumps(key),)).fetchone()
+                if row is not None:
+                    self.disk_hits += 1
+                    value = _load_value(row[0])
+                    self._remember(key, value)
+                    return _copy_words(value[0]), set(value[1])
+
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, valid_words, letters_set):
+        """
+        Stores a result in memory and, if enabled, on disk. A SolveResult is
+        kept in its compact form.
+        """
+        words = valid_words.copy() if isinstance(valid_words, SolveResult) else tuple(valid_words)
+        value = (words, frozenset(letters_set))
+        with self._lock:
+            self._remember(key, value)
+            if self.disk_path:
+                db = self._connect()
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                        (json.dumps(key), _dump_value(value)),
+                    )
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self, disk: bool = False):
+        """Drops the in-memory entries, and the on-disk ones too if disk=True."""
+        with self._lock:
+            self._entries.clear()
+            if disk and self.disk_path:
+                db = self._connect()
+                with db:
+                    db.execute("DELETE FROM results")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk_path": self.disk_path,
+            }
+
+def is_narrowing(previous: tuple, current: tuple) -> bool:
+    """
+    True if every word passing the 'current' filters also passes 'previous'.
+    Filters are (min_length, max_length, must_contain, prefix, suffix, pattern),
+    with max_length 0 meaning no maximum.
+    """
+    old_min, old_max, old_contain, old_prefix, old_suffix, old_pattern = previous
+    new_min, new_max, new_contain, new_prefix, new_suffix, new_pattern = current
+    return (new_min >= old_min
+            and (old_max == 0 or 0 < new_max <= old_max)
+            and old_contain in new_contain
+            and new_prefix.startswith(old_prefix)
+            and new_suffix.endswith(old_suffix)
+            and old_pattern in ("", new_pattern))
+
+class CandidateCache:
+    """
+    The scored candidates of the last full solve, as (word ids, raw scores)
+    arrays, kept so a follow-up query
+    that only tightens the filters (a higher minimum length, a lower maximum,
+    a longer must_contain, ...) can filter them instead of rescanning the
+    dictionary.
+
+    'base' is everything about a query except its filters and limit, so a
+    different dictionary, letter set, scorer or membership filter never
+    matches. Only full solves are stored: a refined query keeps the broader
+    set around, so backing out of a refinement (deleting a typed letter)
+    is a refinement of it too.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entry = None
+        self.refinements = 0
+        self.misses = 0
+
+    def get(self, base: tuple, filters: tuple):
+        """Returns the stored (ids, scores) candidates if 'filters' narrow them, else None."""
+        with self._lock:
+            entry = self._entry
+            if entry is not None and entry[0] == base and is_narrowing(entry[1], filters):
+                self.refinements += 1
+                return entry[2]
+            self.misses += 1
+            return None
+
+    def put(self, base: tuple, filters: tuple, candidates):
+        with self._lock:
+            self._entry = (base, filters, candidates)
+
+    def clear(self):
+        with self._lock:
+            self._entry = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "refinements": self.refinements,
+                "misses": self.misses,
+                "candidates": len(self._entry[2][0]) if self._entry is not None else 0,
+            }
@@ -0,0 +1,76 @@
+import json
+import os
+import urllib.error
+import urllib.request
+
+DEFAULT_SERVER_URL = "http://127.0.0.1:8765"
+
+def server_available(server_url: str = DEFAULT_SERVER_URL, timeout: float = 0.5) -> bool:
+    """Returns True if a solve server answers /health at server_url."""
+    try:
+        with urllib.request.urlopen(f"{server_url}/health", timeout=timeout) as response:
+            return response.status == 200
+    except (OSError, urllib.error.URLError):
+        return False
+
+def find_spelling_bee_words(
+    server_url: str,
+    dictionary_path: str,
+    center: str,
+    other_letters: str,
+    min_length: int = 4,
+    max_length: int = 0,
+    must_contain: str = "",
+    limit: int = 0,
+    prefix: str = "",
+    suffix: str = "",
+    pattern: str = "",
+    scoring: str = "ngram",
+    timeout: float = 60.0,
+):
+    """
+    Same as enhanced_spelling_bee.find_spelling_bee_words, but solved by a
+    running solve_server.py. Returns (list of (word, score), letters_set).
+    Raises OSError if the server cannot be reached or rejects the request.
+    """
+    body = json.dumps({
+        # The server may run elsewhere on disk, so always send absolute paths.
+        "dictionary": os.path.abspath(dictionary_path),
+        "center": center,
+        "others": other_letters,
+        "min_length": min_length,
+        "max_length": max_length,
+        "must_contain": must_contain,
+        "limit": limit,
+        "prefix": prefix,
+        "suffix": suffix,
+        "pattern": pattern,
+        "scoring": scoring,
+    }).encode("utf-8")
+    payload = _post(server_url, "/solve", body, timeout)
+    return [tuple(ws) for ws in payload["words"]], set(payload["letters"])
+
+def puzzle_ranks(server_url: str, dictionary_path: str, center: str, other_letters: str, timeout: float = 60.0):
+    """
+    Same as enhanced_spelling_bee.puzzle_ranks, but looked up by a running
+    solve_server.py, so the client never loads the dictionary.
+    Raises OSError if the server cannot be reached or rejects the request.
+    """
+    body = json.dumps({
+        "dictionary": os.path.abspath(dictionary_path),
+        "center": center,
+        "others": other_letters,
+    }).encode("utf-8")
+    ranks = _post(server_url, "/ranks", body, timeout)["ranks"]
+    if ranks is not None:
+        ranks["ranks"] = [tuple(rank) for rank in ranks["ranks"]]
+    return ranks
+
+def _post(server_url: str, route: str, body: bytes, timeout: float) -> dict:
+    request = urllib.request.Request(
+        f"{server_url}{route}", data=body, headers={"Content-Type": "application/json"}, method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        raise OSError(f"solve server error {e.code}: {e.read().decode('utf-8', 'replace')}")
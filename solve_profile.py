@@ -0,0 +1,103 @@
+import contextlib
+import cProfile
+import time
+import tracemalloc
+
+class PhaseStats:
+    """Timing of one solve phase: wall time, items produced and peak traced memory."""
+
+    __slots__ = ("name", "wall_ms", "count", "peak_bytes")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall_ms = 0.0
+        self.count = None
+        self.peak_bytes = None
+
+    def as_dict(self) -> dict:
+        return {"wall_ms": self.wall_ms, "count": self.count, "peak_bytes": self.peak_bytes}
+
+class SolveProfile:
+    """
+    Opt-in instrumentation for one query. Pass an instance as 'profile=' to
+    find_spelling_bee_words / print_results and read the per-phase stats back:
+    load, filter, score, sort, normalize and render.
+
+    track_memory=True records each phase's peak allocation with tracemalloc
+    (slows the solve down noticeably). cprofile_path writes cProfile/pstats
+    output for the whole solve to that file.
+    """
+
+    def __init__(self, track_memory: bool = False, cprofile_path: str = None):
+        self.track_memory = track_memory
+        self.cprofile_path = cprofile_path
+        self.phases = {}
+        self.cache_hit = False
+        self._profiler = None
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Times the enclosed block as phase 'name'. Yields the PhaseStats so the
+        block can set .count (e.g. number of candidates it produced).
+        """
+        stats = self.phases.get(name) or PhaseStats(name)
+        self.phases[name] = stats
+        started_tracing = False
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.wall_ms += (time.perf_counter() - start) * 1000
+            if self.track_memory:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                stats.peak_bytes = max(stats.peak_bytes or 0, peak)
+                if started_tracing:
+                    tracemalloc.stop()
+
+    @contextlib.contextmanager
+    def cprofile(self):
+        """Runs the enclosed block under cProfile if cprofile_path is set."""
+        if not self.cprofile_path:
+            yield
+            return
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        try:
+            yield
+        finally:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.cprofile_path)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(stats.wall_ms for stats in self.phases.values())
+
+    def as_dict(self) -> dict:
+        return {
+            "cache_hit": self.cache_hit,
+            "total_ms": self.total_ms,
+            "phases": {name: stats.as_dict() for name, stats in self.phases.items()},
+        }
+
+    def summary_line(self) -> str:
+        """One-line summary for status bars, e.g. 'load 0.1 ms | filter 0.3 ms (917) | ...'."""
+        parts = []
+        for stats in self.phases.values():
+            part = f"{stats.name} {stats.wall_ms:.1f} ms"
+            if stats.count is not None:
+                part += f" ({stats.count})"
+            parts.append(part)
+        if self.cache_hit:
+            parts.append("cached")
+        return " | ".join(parts)
+
+def null_phase(name: str):
+    """Stand-in for SolveProfile.phase when no profile is requested."""
+    return contextlib.nullcontext(PhaseStats(name))
@@ -0,0 +1,109 @@
+import sys
+from array import array
+
+class SolveResult:
+    """
+    The results of one solve, best first, as parallel arrays instead of a list
+    of (word, score) tuples:
+      ids       array('I') of positions in the dictionary's word list
+      scores    array('f') of float32 scores
+      lengths   array('B') of word lengths ('H' if a word is over 255 letters)
+      pangrams  bitset (bytearray), bit k set if result k is a pangram
+    'words' is the dictionary's own word list, shared rather than copied.
+
+    Iterating yields (word, score) tuples and indexing returns one (a slice a
+    list of them), so code written for the old list of pairs keeps working.
+    With integer_scores (NYT points) scores come back as ints.
+    """
+
+    __slots__ = ("words", "ids", "scores", "lengths", "pangrams", "integer_scores")
+
+    def __init__(self, words, ids, scores, lengths, pangrams, integer_scores=False):
+        self.words = words
+        self.ids = ids
+        self.scores = scores
+        self.lengths = lengths
+        self.pangrams = pangrams
+        self.integer_scores = integer_scores
+
+    @classmethod
+    def build(cls, words, ids, scores, lengths, pangram_flags, integer_scores=False):
+        """Packs parallel sequences (or iterables) of word ids, scores, lengths and pangram flags."""
+        ids = array("I", ids)
+        pangrams = bytearray((len(ids) + 7) // 8)
+        for k, pangram in enumerate(pangram_flags):
+            if pangram:
+                pangrams[k >> 3] |= 1 << (k & 7)
+        try:
+            packed_lengths = array("B", lengths)
+        except OverflowError:
+            packed_lengths = array("H", lengths)
+        return cls(words, ids, array("f", scores), packed_lengths, pangrams, integer_scores)
+
+    def copy(self):
+        """A copy whose arrays can be changed (e.g. normalized) independently."""
+        return SolveResult(self.words, array(self.ids.typecode, self.ids), array("f", self.scores),
+                           array(self.lengths.typecode, self.lengths), bytearray(self.pangrams),
+                           self.integer_scores)
+
+    def normalize(self):
+        """Rescales the scores in place so the best is 100."""
+        scores = self.scores
+        top = max(scores, default=0)
+        if top:
+            scores[:] = array("f", [score / top * 100 for score in scores])
+
+    def word(self, k: int) -> str:
+        return self.words[self.ids[k]]
+
+    def score(self, k: int):
+        return int(self.scores[k]) if self.integer_scores else self.scores[k]
+
+    def is_pangram(self, k: int) -> bool:
+        return bool(self.pangrams[k >> 3] >> (k & 7) & 1)
+
+    def iter_rows(self):
+        """Yields (word, score, pangram) without re-deriving the pangram flag."""
+        words, pangrams, integer = self.words, self.pangrams, self.integer_scores
+        for k, (i, score) in enumerate(zip(self.ids, self.scores)):
+            yield words[i], int(score) if integer else score, pangrams[k >> 3] >> (k & 7) & 1 == 1
+
+    def pangram_count(self) -> int:
+        return sum(bin(byte).count("1") for byte in self.pangrams)
+
+    def total_score(self):
+        total = sum(self.scores)
+        return int(total) if self.integer_scores else total
+
+    def nbytes(self) -> int:
+        """Memory held by the result itself, in bytes (the shared word list is not counted)."""
+        return (sys.getsizeof(self) + sys.getsizeof(self.ids) + sys.getsizeof(self.scores)
+                + sys.getsizeof(self.lengths) + sys.getsizeof(self.pangrams))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        words = self.words
+        if self.integer_scores:
+            return ((words[i], int(s)) for i, s in zip(self.ids, self.scores))
+        return ((words[i], s) for i, s in zip(self.ids, self.scores))
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [(self.word(j), self.score(j)) for j in range(*k.indices(len(self.ids)))]
+        if k < 0:
+            k += len(self.ids)
+        if not 0 <= k < len(self.ids):
+            raise IndexError("result index out of range")
+        return self.word(k), self.score(k)
+
+    def __eq__(self, other):
+        if isinstance(other, (SolveResult, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"SolveResult({len(self.ids)} words)"
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from rich.console import Console
+
+from enhanced_spelling_bee import (
+    SCORING_MODES, dictionary_cache_stats, find_spelling_bee_words, get_index, get_model, get_word_scores,
+    puzzle_ranks,
+)
+
+console = Console()
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 64 * 1024
+
+class BadRequest(Exception):
+    pass
+
+def parse_args():
+    """
+    Parse command-line arguments for the solve server.
+    Example usage:
+        python solve_server.py --port 8765 --preload words_enable.txt
+    """
+    parser = argparse.ArgumentParser(
+        description="Serve find_spelling_bee_words over HTTP/JSON on localhost with a warm engine."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to bind (default: {DEFAULT_HOST}).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT}).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Executor threads for solves (default: CPU count)."
+    )
+    parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        help="Dictionary to load (and score) before accepting requests; may be repeated."
+    )
+    return parser.parse_args()
+
+def _query_from_json(body: dict) -> tuple:
+    """
+    Validates a /solve request body and returns its canonical query tuple:
+    (dictionary, center, others, min_length, max_length, must_contain, limit,
+    prefix, suffix, pattern, scoring).
+    """
+    try:
+        query = (
+            os.path.realpath(str(body["dictionary"])),
+            str(body["center"]).strip().lower(),
+            str(body["others"]).strip().lower(),
+            int(body.get("min_length", 4)),
+            int(body.get("max_length", 0)),
+            str(body.get("must_contain", "")).strip().lower(),
+            int(body.get("limit", 0)),
+            str(body.get("prefix", "")).strip().lower(),
+            str(body.get("suffix", "")).strip().lower(),
+            str(body.get("pattern", "")).strip().lower(),
+            str(body.get("scoring", "ngram")).strip().lower(),
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise BadRequest(f"invalid solve request: {e!r}")
+    if query[-1] not in SCORING_MODES:
+        raise BadRequest(f"invalid scoring mode {query[-1]!r}")
+    return query
+
+def _puzzle_from_json(body: dict) -> tuple:
+    """Validates a /ranks request body and returns (dictionary, center, others)."""
+    try:
+        return (
+            os.path.realpath(str(body["dictionary"])),
+            str(body["center"]).strip().lower(),
+            str(body["others"]).strip().lower(),
+        )
+    except (KeyError, TypeError) as e:
+        raise BadRequest(f"invalid ranks request: {e!r}")
+
+def ranks(puzzle: tuple) -> dict:
+    """Returns the JSON response body with the puzzle's NYT totals and rank thresholds."""
+    return {"ranks": puzzle_ranks(*puzzle)}
+
+def solve(query: tuple) -> dict:
+    """Runs one query on the warm engine and returns the JSON response body."""
+    dictionary, center, others, min_length, max_length, must_contain, limit, prefix, suffix, pattern, scoring = query
+    valid_words, letters_set = find_spelling_bee_words(
+        dictionary_path=dictionary,
+        center=center,
+        other_letters=others,
+        min_length=min_length,
+        max_length=max_length,
+        must_contain=must_contain,
+        limit=limit,
+        prefix=prefix,
+        suffix=suffix,
+        pattern=pattern,
+        scoring=scoring,
+    )
+    # Scores are float32 internally; round them so the JSON carries no noise.
+    return {"letters": sorted(letters_set), "words": [(w, round(s, 2)) for w, s in valid_words]}
+
+def _json_object(body: bytes) -> dict:
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError as e:
+        raise BadRequest(f"invalid JSON: {e}")
+    if not isinstance(payload, dict):
+        raise BadRequest("request body must be a JSON object")
+    return payload
+
+class SolveServer:
+    """
+    Asyncio HTTP/JSON front end for the solver.
+
+    Solves run on a thread pool so the event loop never blocks, and identical
+    queries that arrive while one is already running share its result instead
+    of being solved again.
+    """
+
+    def __init__(self, workers: int):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="solve")
+        self.in_flight = {}
+        self.requests = 0
+        self.solves = 0
+        self.coalesced = 0
+        self.started = time.time()
+
+    async def solve(self, query: tuple) -> dict:
+        future = self.in_flight.get(query)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, solve, query)
+        self.in_flight[query] = future
+        self.solves += 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self.in_flight.pop(query, None)
+
+    def stats(self) -> dict:
+        return {
+            "uptime": time.time() - self.started,
+            "requests": self.requests,
+            "solves": self.solves,
+            "coalesced": self.coalesced,
+            "in_flight": len(self.in_flight),
+            "dictionary_cache": dictionary_cache_stats(),
+        }
+
+    async def dispatch(self, method: str, path: str, body: bytes):
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        if method == "GET" and path == "/stats":
+            return 200, self.stats()
+        if method == "POST" and path == "/solve":
+            payload = _json_object(body)
+            return 200, await self.solve(_query_from_json(payload))
+        if method == "POST" and path == "/ranks":
+            payload = _json_object(body)
+            loop = asyncio.get_running_loop()
+            return 200, await loop.run_in_executor(self.executor, ranks, _puzzle_from_json(payload))
+        return 404, {"error": f"no route for {method} {path}"}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.requests += 1
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if len(request_line) < 2:
+                raise BadRequest("malformed request line")
+            length = int(headers.get("content-length", 0))
+            if length > MAX_BODY_BYTES:
+                raise BadRequest("request body too large")
+            body = await reader.readexactly(length) if length else b""
+            status, payload = await self.dispatch(request_line[0].upper(), request_line[1], body)
+        except (BadRequest, ValueError, asyncio.IncompleteReadError) as e:
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            console.print(f"[red]Solve failed: {e}[/red]")
+            status, payload = 500, {"error": str(e)}
+
+        data = json.dumps(payload).encode("utf-8")
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found"}.get(status, "Internal Server Error")
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + data
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+async def serve(host: str, port: int, workers: int, preload):
+    """Warms the engine, then serves until cancelled."""
+    app = SolveServer(workers)
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(app.executor, get_model)
+    for dictionary_path in preload:
+        await loop.run_in_executor(app.executor, lambda p=dictionary_path: get_word_scores(get_index(p)))
+
+    server = await asyncio.start_server(app.handle, host, port)
+    console.print(f"[green]Spelling Bee solve server listening on http://{host}:{port}[/green]")
+    async with server:
+        await server.serve_forever()
+
+def main():
+    args = parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.preload))
+    except KeyboardInterrupt:
+        console.print("\n[bold green]Server stopped.[/bold green]")
+
+if __name__ == "__main__":
+    main()
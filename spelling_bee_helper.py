@@ -6,6 +6,11 @@ import csv
 from rich.console import Console
 from rich.table import Table
 
+# The shared engine caches each dictionary, its letter index and per-mask
+# aggregates, so repeated calls never reload or rescan the word list.
+from enhanced_spelling_bee import iter_result_rows, load_dictionary, puzzle_ranks
+from enhanced_spelling_bee import find_spelling_bee_words as solve_puzzle
+
 console = Console()
 
 def parse_args():
@@ -44,12 +49,6 @@ def parse_args():
     )
     return parser.parse_args()
 
-def load_dictionary(dictionary_path: str) -> list:
-    """Loads words from a text file, returning them as a list of lowercase words."""
-    with open(dictionary_path, 'r', encoding='utf-8') as f:
-        words = [w.strip().lower() for w in f if w.strip()]
-    return words
-
 def is_valid_word(word: str, center: str, letters_set: set) -> bool:
     """
     A valid Spelling Bee word must:
@@ -91,7 +90,7 @@ def gather_statistics(valid_words, letters_set):
       - Sum of scores
     """
     total_words = len(valid_words)
-    pangrams_count = sum(is_pangram(w, letters_set) for w, s in valid_words)
+    pangrams_count = sum(pangram for w, s, pangram in iter_result_rows(valid_words, letters_set))
     avg_length = sum(len(w) for w, s in valid_words) / total_words if total_words else 0
     total_points = sum(s for w, s in valid_words)
 
@@ -104,31 +103,20 @@ def gather_statistics(valid_words, letters_set):
 
 def find_spelling_bee_words(dictionary_path: str, center: str, other_letters: str, csv_path: str = None):
     """
-    1. Loads the dictionary.
-    2. Filters valid words based on Spelling Bee constraints.
-    3. Calculates each word's score.
-    4. Prints the results sorted by descending score, then length, then alphabetical.
-    5. Optionally writes the results to CSV if csv_path is provided.
+    1. Solves the puzzle with the shared engine in NYT scoring mode (the same
+       points as compute_score), sorted by descending score, then length,
+       then alphabetical.
+    2. Looks up the puzzle's maximum points and rank thresholds from the
+       dictionary's per-mask aggregates.
+    3. Prints the results.
+    4. Optionally writes the results to CSV if csv_path is provided.
     """
     # Normalize letters to lowercase
     center = center.lower()
     other_letters = other_letters.lower()
 
-    # Build the set of 7 letters
-    letters_set = set(center + other_letters)
-
-    # Load all dictionary words
-    word_list = load_dictionary(dictionary_path)
-
-    # Filter valid words and compute their scores
-    valid_words = []
-    for word in word_list:
-        if is_valid_word(word, center, letters_set):
-            score = compute_score(word, letters_set)
-            valid_words.append((word, score))
-
-    # Sort by descending score, then by descending word length, then alphabetically
-    valid_words.sort(key=lambda ws: (-ws[1], -len(ws[0]), ws[0]))
+    valid_words, letters_set = solve_puzzle(dictionary_path, center, other_letters, scoring="nyt")
+    ranks = puzzle_ranks(dictionary_path, center, other_letters)
 
     # Gather additional statistics
     stats = gather_statistics(valid_words, letters_set)
@@ -140,9 +128,8 @@ def find_spelling_bee_words(dictionary_path: str, center: str, other_letters: st
     table.add_column("Pangram?", justify="center", style="green")
 
     # Build table rows
-    for (w, s) in valid_words:
-        pangram_flag = "Yes" if is_pangram(w, letters_set) else ""
-        table.add_row(w, str(s), pangram_flag)
+    for (w, s, pangram) in iter_result_rows(valid_words, letters_set):
+        table.add_row(w, str(s), "Yes" if pangram else "")
 
     # Print summary info above the table
     console.print("============================================", style="bold yellow")
@@ -152,6 +139,10 @@ def find_spelling_bee_words(dictionary_path: str, center: str, other_letters: st
     console.print(f"Number pangrams  : {stats['pangrams_count']}", style="bold white")
     console.print(f"Average length   : {stats['avg_length']:.2f}", style="bold white")
     console.print(f"Sum of all scores: {stats['total_points']}", style="bold white")
+    if ranks is not None:
+        thresholds = dict(ranks["ranks"])
+        console.print(f"Genius           : {thresholds['Genius']} points", style="bold white")
+        console.print(f"Queen Bee        : {thresholds['Queen Bee']} points", style="bold white")
     console.print("============================================", style="bold yellow")
 
     # Print the table of words
@@ -163,8 +154,8 @@ def find_spelling_bee_words(dictionary_path: str, center: str, other_letters: st
             with open(csv_path, mode="w", newline="", encoding="utf-8") as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(["word", "score", "pangram"])
-                for (w, s) in valid_words:
-                    writer.writerow([w, s, "Yes" if is_pangram(w, letters_set) else "No"])
+                for (w, s, pangram) in iter_result_rows(valid_words, letters_set):
+                    writer.writerow([w, s, "Yes" if pangram else "No"])
             console.print(f"\n[green]Results successfully written to {csv_path}![/green]")
         except Exception as e:
             console.print(f"[red]Failed to write CSV file: {e}[/red]")
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+import benchmark
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+@pytest.fixture(autouse=True)
+def _in_repo(monkeypatch):
+    # measure_import_ms imports by module name in a fresh interpreter.
+    monkeypatch.chdir(REPO_DIR)
+
+@pytest.mark.parametrize("module", sorted(benchmark.IMPORT_BUDGETS_MS))
+def test_import_within_budget(module):
+    # measure_import_ms raises AssertionError if the import pulled in NLTK
+    # or loaded the n-gram model.
+    best_ms = min(benchmark.measure_import_ms(module) for _ in range(3))
+    assert best_ms <= benchmark.IMPORT_BUDGETS_MS[module]
+
+def test_check_import_budget():
+    assert benchmark.check_import_budget()
+
+def test_heavy_import_is_caught(tmp_path, monkeypatch):
+    (tmp_path / "pulls_nltk.py").write_text("import sys\nsys.modules['nltk'] = sys\n")
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(AssertionError, match="nltk"):
+        benchmark.measure_import_ms("pulls_nltk")
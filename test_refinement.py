@@ -0,0 +1,96 @@
+import os
+import random
+
+import pytest
+
+import enhanced_spelling_bee as engine
+
+DICTIONARY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words_enable.txt")
+PUZZLES = [("e", "ainrst"), ("o", "cdeprt")]
+
+# Each step tightens the filters of the one before it.
+NARROWING_CHAIN = [
+    {},
+    {"min_length": 5},
+    {"min_length": 5, "max_length": 10},
+    {"min_length": 5, "max_length": 10, "must_contain": "e"},
+    {"min_length": 5, "max_length": 10, "must_contain": "er"},
+    {"min_length": 5, "max_length": 10, "must_contain": "er", "prefix": "r"},
+    {"min_length": 5, "max_length": 10, "must_contain": "er", "prefix": "r", "suffix": "s"},
+    {"min_length": 5, "max_length": 10, "must_contain": "er", "prefix": "r", "suffix": "s", "pattern": "r*s"},
+    {"min_length": 5, "max_length": 10, "must_contain": "er", "prefix": "r", "suffix": "s", "pattern": "r*s",
+     "limit": 3},
+]
+
+def _clear():
+    engine.RESULT_CACHE.clear()
+    engine.CANDIDATE_CACHE.clear()
+
+def _rows(center, others, scoring, filters):
+    valid_words, _ = engine.find_spelling_bee_words(DICTIONARY, center, others, scoring=scoring, **filters)
+    return list(valid_words.iter_rows())
+
+def _fresh(center, others, scoring, filters):
+    _clear()
+    return _rows(center, others, scoring, filters)
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    _clear()
+    yield
+    _clear()
+
+def _check_chain(center, others, scoring, chain):
+    expected = [_fresh(center, others, scoring, filters) for filters in chain]
+    _clear()
+    refinements = engine.candidate_cache_stats()["refinements"]
+    for filters, rows in zip(chain, expected):
+        assert _rows(center, others, scoring, filters) == rows, filters
+    return engine.candidate_cache_stats()["refinements"] - refinements
+
+@pytest.mark.parametrize("scoring", engine.SCORING_MODES)
+@pytest.mark.parametrize("center, others", PUZZLES)
+def test_narrowing_chain_matches_fresh_solve(center, others, scoring):
+    # Every step after the first is answered from the stored candidates.
+    assert _check_chain(center, others, scoring, NARROWING_CHAIN) == len(NARROWING_CHAIN) - 1
+
+@pytest.mark.parametrize("scoring", engine.SCORING_MODES)
+def test_backing_out_of_a_refinement(scoring):
+    chain = NARROWING_CHAIN[:6] + NARROWING_CHAIN[4::-1]
+    assert _check_chain("e", "ainrst", scoring, chain) > 0
+
+def test_widening_is_solved_afresh():
+    _rows("e", "ainrst", "ngram", {"must_contain": "at"})
+    misses = engine.candidate_cache_stats()["misses"]
+    expected = _fresh("e", "ainrst", "ngram", {"must_contain": "ra"})
+    _clear()
+    _rows("e", "ainrst", "ngram", {"must_contain": "at"})
+    assert _rows("e", "ainrst", "ngram", {"must_contain": "ra"}) == expected
+    assert engine.candidate_cache_stats()["misses"] > misses
+
+def _random_step(rng, filters):
+    filters = dict(filters)
+    field = rng.choice(["min_length", "max_length", "must_contain", "prefix", "suffix", "pattern", "limit"])
+    if field == "min_length":
+        filters["min_length"] = filters.get("min_length", 4) + rng.randint(0, 2)
+    elif field == "max_length":
+        filters["max_length"] = rng.randint(filters.get("min_length", 4), filters.get("max_length") or 15)
+    elif field == "must_contain":
+        filters["must_contain"] = filters.get("must_contain", "") + rng.choice("aeinrst")
+    elif field == "prefix":
+        filters["prefix"] = filters.get("prefix", "") + rng.choice("aeinrst")
+    elif field == "suffix":
+        filters["suffix"] = rng.choice("aeinrst") + filters.get("suffix", "")
+    elif field == "pattern":
+        filters.setdefault("pattern", rng.choice(["*s", "re*", "*ing", "?a*", "*e*"]))
+    else:
+        filters["limit"] = rng.randint(1, 50)
+    return filters
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_narrowing_chains(seed):
+    rng = random.Random(seed)
+    chain = [{}]
+    for _ in range(5):
+        chain.append(_random_step(rng, chain[-1]))
+    _check_chain("e", "ainrst", rng.choice(engine.SCORING_MODES), chain)
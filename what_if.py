@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import string
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from enhanced_spelling_bee import get_index, get_word_scores
+from letter_index import LETTER_BITS, letter_mask, subset_masks
+from puzzle_space import PANGRAM_BONUS, PUZZLE_SIZE, word_points
+
+console = Console()
+
+SORT_COLUMNS = ("words", "pangrams", "points", "score")
+
+def _bits(mask: int):
+    return [bit for bit in LETTER_BITS.values() if mask & bit]
+
+def _letter(bit: int) -> str:
+    return string.ascii_lowercase[bit.bit_length() - 1]
+
+# ------------------------ ANALYSIS ------------------------
+
+def analyze_letters(dictionary_path: str, letters: str, sort: str = "points", legal_only: bool = False) -> list:
+    """
+    Ranks every puzzle that can be made from a partial letter set in one pass.
+
+    With six letters, each of the 20 possible seventh letters is tried with
+    each of the 7 resulting letters as center; with seven letters only the
+    center varies. Returns one dict per variant, best first by 'sort':
+      letter   the added seventh letter ('' for a 7-letter input)
+      center   the center letter
+      words    number of valid words
+      pangrams number of pangrams
+      points   NYT points
+      score    sum of the words' combined_score (the n-gram score, unnormalized)
+    With legal_only, variants without a pangram are dropped.
+
+    Every letter-mask bucket that can occur in any variant is read once: words
+    using only the six letters count towards every variant, and a word using
+    the seventh letter only towards that letter's variants.
+    """
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f"unknown sort column {sort!r}; expected one of {', '.join(SORT_COLUMNS)}")
+    base_mask = letter_mask(letters.lower())
+    if base_mask < 0 or base_mask.bit_count() not in (PUZZLE_SIZE - 1, PUZZLE_SIZE):
+        raise ValueError("letters must be 6 or 7 distinct letters a-z")
+
+    index = get_index(dictionary_path)
+    scores = get_word_scores(index)
+    lengths = index.lengths
+
+    def bucket_totals(mask):
+        words = points = 0
+        score = 0.0
+        for i in index.bucket(mask):
+            if lengths[i] >= 4:
+                words += 1
+                points += word_points(lengths[i])
+                score += scores[i]
+        return words, points, score
+
+    def add(totals, center, bucket):
+        entry = totals.setdefault(center, [0, 0, 0.0])
+        entry[0] += bucket[0]
+        entry[1] += bucket[1]
+        entry[2] += bucket[2]
+
+    # Totals per center over words that use only the base letters.
+    base_totals = {}
+    base_pangrams = 0
+    for subset in subset_masks(base_mask):
+        bucket = bucket_totals(subset) if subset else (0, 0, 0.0)
+        if bucket[0]:
+            for center in _bits(subset):
+                add(base_totals, center, bucket)
+            if subset == base_mask and subset.bit_count() == PUZZLE_SIZE:
+                base_pangrams = bucket[0]
+
+    if base_mask.bit_count() == PUZZLE_SIZE:
+        extras = [0]
+    else:
+        extras = [bit for bit in LETTER_BITS.values() if not bit & base_mask]
+
+    rows = []
+    for extra in extras:
+        letters_mask = base_mask | extra
+        totals = {center: list(base_totals.get(center, (0, 0, 0.0))) for center in _bits(letters_mask)}
+        pangrams = base_pangrams
+        if extra:
+            for subset in subset_masks(base_mask):
+                mask = subset | extra
+                bucket = bucket_totals(mask)
+                if bucket[0]:
+                    for center in _bits(mask):
+                        add(totals, center, bucket)
+                    if mask == letters_mask:
+                        pangrams = bucket[0]
+        if legal_only and not pangrams:
+            continue
+        for center, (words, points, score) in totals.items():
+            rows.append({
+                "letter": _letter(extra) if extra else "",
+                "center": _letter(center),
+                "words": words,
+                "pangrams": pangrams,
+                "points": points + PANGRAM_BONUS * pangrams,
+                "score": score,
+            })
+
+    rows.sort(key=lambda row: (-row[sort], row["letter"], row["center"]))
+    return rows
+
+# ------------------------ COMMAND LINE ------------------------
+
+def parse_args():
+    """
+    Parse command-line arguments for the what-if letter analysis.
+    Example usage:
+        python what_if.py oapcin -d words_enable.txt --sort points --top 20
+        python what_if.py toapcin --sort words --csv centers.csv
+    """
+    parser = argparse.ArgumentParser(
+        description="Rank every seventh letter and center for a partial Spelling Bee letter set."
+    )
+    parser.add_argument("letters", help="Six letters (try every seventh) or seven letters (try every center).")
+    parser.add_argument(
+        "-d", "--dictionary",
+        default="words_enable.txt",
+        help="Path to dictionary file, text or compiled (default: words_enable.txt)."
+    )
+    parser.add_argument(
+        "--sort",
+        choices=SORT_COLUMNS,
+        default="points",
+        help="Column to rank by (default: points)."
+    )
+    parser.add_argument(
+        "--legal",
+        action="store_true",
+        help="Only show variants with at least one pangram."
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of variants to print (default: 20, 0 = all)."
+    )
+    parser.add_argument(
+        "--csv",
+        dest="csv_path",
+        default=None,
+        help="Optional path to write every variant as CSV."
+    )
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    start = time.perf_counter()
+    try:
+        rows = analyze_letters(args.dictionary, args.letters, args.sort, args.legal)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        return
+    elapsed = time.perf_counter() - start
+
+    console.print(f"Dictionary       : {args.dictionary}", style="bold white")
+    console.print(f"Letters          : {args.letters.lower()}", style="bold white")
+    console.print(f"Variants         : {len(rows)}", style="bold white")
+    console.print(f"Time             : {elapsed * 1000:.1f} ms", style="bold white")
+
+    table = Table(title=f"Variants by {args.sort}")
+    table.add_column("Added", justify="center", style="cyan")
+    table.add_column("Center", justify="center", style="cyan")
+    table.add_column("Words", justify="right", style="magenta")
+    table.add_column("Pangrams", justify="right", style="green")
+    table.add_column("Points", justify="right", style="magenta")
+    table.add_column("Score", justify="right", style="yellow")
+    for row in rows[:args.top] if args.top else rows:
+        table.add_row(row["letter"], row["center"], str(row["words"]), str(row["pangrams"]),
+                      str(row["points"]), f"{row['score']:.2f}")
+    console.print(table)
+
+    if args.csv_path:
+        try:
+            with open(args.csv_path, mode="w", newline="", encoding="utf-8") as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(["letter", "center", "words", "pangrams", "points", "score"])
+                writer.writerows(
+                    (row["letter"], row["center"], row["words"], row["pangrams"], row["points"], f"{row['score']:.2f}")
+                    for row in rows
+                )
+            console.print(f"\n[green]Results successfully written to {args.csv_path}![/green]")
+        except Exception as e:
+            console.print(f"[red]Failed to write CSV file: {e}[/red]")
+
+if __name__ == "__main__":
+    main()